@@ -1,46 +1,33 @@
-# Example of using procyclingstats package asynchronously. Third party
-# "requests_futures" package is needed to run the example.
+# Example of using procyclingstats package concurrently. Scraper objects are
+# created with `Scraper.fetch_many` class method which makes requests using a
+# thread pool.
 import time
-from concurrent.futures import as_completed
 from pprint import pprint
 
-from requests_futures.sessions import FuturesSession
-
 from procyclingstats import Ranking, Rider
 
 
 def main():
     ranking = Ranking("rankings/me/individual-season").individual_ranking()
-    # get heights of first 50 riders from the ranking asynchronously
-    futures_heights = ranking_heights_future(ranking)
+    # get heights of first 50 riders from the ranking concurrently
+    concurrent_heights = ranking_heights_concurrent(ranking)
     # get heights of first 50 riders from the ranking synchronously
     heights = ranking_heights(ranking)
-    pprint(futures_heights)
+    pprint(concurrent_heights)
 
-def ranking_heights_future(ranking):
+def ranking_heights_concurrent(ranking):
     t1 = time.time()
-    session = FuturesSession()
-    # initialize list with future sessions
-    future_sessions = []
-    # make requests to all stage pages asynchronously and store them in a list
-    for row in ranking[:50]:
-        # create absolute URL from stage_url in the table
-        # start making request to the URL
-        url = "https://www.procyclingstats.com/" + row['rider_url']
-        future_session = session.get(url)
-        future_sessions.append(future_session)
-
-    # create rider objects from obtained HTMLs and store heights in 
-    # riders_heights dict, make sure you don't use
-    # concurrent.futures.as_completed(future_sessions)
-    # in the for loop, because in that case the order of riders won't be
-    # preserved
+    urls = [row['rider_url'] for row in ranking[:50]]
+    # rider objects are returned in the same order as the URLs, when creating
+    # of an object fails, the exception is returned in its place
+    riders = Rider.fetch_many(urls, max_workers=8)
     riders_heights = {}
-    for i, future_session in enumerate(future_sessions):
-        html = future_session.result().text
-        rider = Rider(ranking[i]['rider_url'], html=html, update_html=False)
+    for url, rider in zip(urls, riders):
+        if isinstance(rider, Exception):
+            print(f"Failed to get {url}: {rider}")
+            continue
         riders_heights[rider.relative_url()] = rider.height()
-    print("With requests_futures package:", time.time() - t1)
+    print("With Rider.fetch_many:", time.time() - t1)
     return riders_heights
     
 def ranking_heights(ranking):
@@ -49,7 +36,7 @@ def ranking_heights(ranking):
     for row in ranking[:50]:
         rider = Rider(row['rider_url'])
         riders_heights[rider.relative_url()] = rider.height()
-    print("Without requests_futures package:", time.time() - t1)
+    print("Without Rider.fetch_many:", time.time() - t1)
     return riders_heights
 
 if __name__ == "__main__":
@@ -1,17 +1,27 @@
+import importlib
 import os
 import sys
+from typing import TYPE_CHECKING, Any, Dict, List
 
-from .race_climbs_scraper import RaceClimbs
-from .race_scraper import Race
-from .race_startlist_scraper import RaceStartlist
-from .ranking_scraper import Ranking
-from .rider_results_scraper import RiderResults
-from .rider_scraper import Rider
-from .scraper import Scraper
-from .stage_scraper import Stage
-from .team_scraper import Team
-from .teams_scraper import Teams
-from .nation_scraper import Nation
+if TYPE_CHECKING:
+    from .cache import HTMLCache, get_cache, season_ttl_policies, set_cache
+    from .frames import to_arrow, to_frame
+    from .race_climbs_scraper import RaceClimbs
+    from .race_scraper import Race
+    from .ratelimit import RateLimiter, get_rate_limiter, set_rate_limiter
+    from .replay import RecordingSession, ReplaySession
+    from .race_startlist_scraper import RaceStartlist
+    from .ranking_scraper import Ranking
+    from .rider_results_scraper import RiderResults
+    from .rider_scraper import Rider
+    from .scraper import Scraper
+    from .session import (AsyncTransport, HTTPSession, SingleFlight,
+                          ThreadedTransport, configure_session, get_session,
+                          get_transport, set_session, set_transport)
+    from .stage_scraper import Stage
+    from .team_scraper import Team
+    from .teams_scraper import Teams
+    from .nation_scraper import Nation
 
 __all__ = [
     "Scraper",
@@ -24,7 +34,85 @@ __all__ = [
     "Stage",
     "Team",
     "Teams",
-    "Nation"
+    "Nation",
+    "HTTPSession",
+    "AsyncTransport",
+    "ThreadedTransport",
+    "configure_session",
+    "get_session",
+    "set_session",
+    "get_transport",
+    "set_transport",
+    "SingleFlight",
+    "HTMLCache",
+    "get_cache",
+    "set_cache",
+    "season_ttl_policies",
+    "RateLimiter",
+    "get_rate_limiter",
+    "set_rate_limiter",
+    "RecordingSession",
+    "ReplaySession",
+    "to_frame",
+    "to_arrow"
 ]
 
+_modules: Dict[str, str] = {
+    "Scraper": "scraper",
+    "RaceClimbs": "race_climbs_scraper",
+    "Race": "race_scraper",
+    "RaceStartlist": "race_startlist_scraper",
+    "Ranking": "ranking_scraper",
+    "RiderResults": "rider_results_scraper",
+    "Rider": "rider_scraper",
+    "Stage": "stage_scraper",
+    "Team": "team_scraper",
+    "Teams": "teams_scraper",
+    "Nation": "nation_scraper",
+    "HTTPSession": "session",
+    "AsyncTransport": "session",
+    "ThreadedTransport": "session",
+    "configure_session": "session",
+    "get_session": "session",
+    "set_session": "session",
+    "get_transport": "session",
+    "set_transport": "session",
+    "SingleFlight": "session",
+    "HTMLCache": "cache",
+    "get_cache": "cache",
+    "set_cache": "cache",
+    "season_ttl_policies": "cache",
+    "RateLimiter": "ratelimit",
+    "get_rate_limiter": "ratelimit",
+    "set_rate_limiter": "ratelimit",
+    "RecordingSession": "replay",
+    "ReplaySession": "replay",
+    "to_frame": "frames",
+    "to_arrow": "frames"
+}
+"""Modules of the package attributes, imported on the first access."""
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Imports module of given package attribute when it's accessed for the
+    first time (PEP 562). Importing the package then doesn't import all the
+    scrapers together with `requests` and `selectolax`.
+
+    :param name: Name of the attribute, e.g. ``Rider``.
+    :raises AttributeError: When the package doesn't have such attribute.
+    :return: Value of the attribute.
+    """
+    if name not in _modules:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    module = importlib.import_module(f".{_modules[name]}", __package__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
 sys.path.append(os.path.dirname(os.path.realpath(__file__)))
@@ -0,0 +1,49 @@
+import threading
+from typing import Any, Tuple
+
+from requests.adapters import HTTPAdapter
+
+
+class CountingAdapter(HTTPAdapter):
+    """
+    HTTP adapter that keeps track of how many connections were opened by its
+    connection pools, including pools that were already evicted.
+    """
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self._retired_lock = threading.Lock()
+        self._retired_connections = 0
+        self._retired_requests = 0
+        pools = self.poolmanager.pools
+        dispose = pools.dispose_func
+
+        def retire(pool: Any) -> None:
+            with self._retired_lock:
+                self._retired_connections += pool.num_connections
+                self._retired_requests += pool.num_requests
+            # urllib3 2.x doesn't close evicted pools explicitly
+            if dispose is not None:
+                dispose(pool)
+
+        pools.dispose_func = retire
+
+    def pool_counts(self) -> Tuple[int, int]:
+        """
+        Sums counters of all connection pools of the adapter.
+
+        :return: Tuple of opened connections count and sent requests count.
+        """
+        with self._retired_lock:
+            connections = self._retired_connections
+            requests_count = self._retired_requests
+        pools = self.poolmanager.pools
+        for key in pools.keys():
+            try:
+                pool = pools[key]
+            except KeyError:
+                # pool was evicted in the meantime and is already counted
+                continue
+            connections += pool.num_connections
+            requests_count += pool.num_requests
+        return connections, requests_count
@@ -0,0 +1,374 @@
+import datetime
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import zlib
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlsplit
+
+TTL = Union[None, float, Callable[[re.Match], Optional[float]]]
+"""
+Time to live of cached page in seconds. None means that the page never
+expires. Callable is called with match of the policy pattern and returns the
+TTL.
+"""
+
+
+def season_ttl_policies(current_season_ttl: float = 6 * 3600,
+                        default_ttl: Optional[float] = 24 * 3600
+                        ) -> List[Tuple[str, TTL]]:
+    """
+    Creates TTL policies where pages of finished seasons never expire, pages
+    of current (or future) season expire after `current_season_ttl` and other
+    pages (without season in the URL, e.g. rider overview) after
+    `default_ttl`.
+
+    :param current_season_ttl: TTL of pages of current season in seconds,
+        defaults to 6 hours.
+    :param default_ttl: TTL of pages without season in URL in seconds,
+        defaults to 24 hours.
+    :return: List of policies that can be passed to `HTMLCache`.
+    """
+    def season_ttl(match: re.Match) -> Optional[float]:
+        if int(match.group(1)) < datetime.date.today().year:
+            return None
+        return current_season_ttl
+
+    return [
+        (r"(?<!\d)((?:18|19|20)\d\d)(?!\d)", season_ttl),
+        (r".", default_ttl)
+    ]
+
+
+def _cache_url(url: str) -> str:
+    """
+    Makes URL under which page of given URL is cached. Relative URL is made
+    absolute using `Scraper.BASE_URL`, the same way scraper objects do it.
+
+    :param url: Absolute or relative URL of the page.
+    :return: Canonical absolute URL of the page.
+    """
+    # imported here, so creating the cache doesn't import selectolax
+    # pylint: disable=import-outside-toplevel
+    from .scraper import Scraper
+    from .utils import canonical_url
+    if not urlsplit(url).scheme:
+        url = Scraper.BASE_URL + url.lstrip("/")
+    return canonical_url(url)
+
+
+class CacheEntry:
+    """
+    Page stored in `HTMLCache`. Body is kept compressed and is decompressed
+    only when accessed, unless the decompressed body is given.
+
+    :param url: Canonical URL of the page.
+    :param compressed_body: Zlib compressed HTML of the page encoded with
+        `encoding`.
+    :param encoding: Encoding of the body.
+    :param fetched_at: Unix timestamp when the page was fetched or last
+        revalidated.
+    :param etag: ETag header of the response, defaults to None.
+    :param last_modified: Last-Modified header of the response, defaults to
+        None.
+    :param fresh: Whether the entry hasn't expired yet, defaults to True.
+    :param body: Decompressed body when it's already known, defaults to None.
+    """
+
+    def __init__(self, url: str, compressed_body: bytes, encoding: str,
+                 fetched_at: float, etag: Optional[str] = None,
+                 last_modified: Optional[str] = None,
+                 fresh: bool = True, body: Optional[bytes] = None) -> None:
+        self.url = url
+        self.compressed_body = compressed_body
+        self._body = body
+        self.encoding = encoding
+        self.fetched_at = fetched_at
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fresh = fresh
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(url='{self.url}', fresh={self.fresh})"
+
+    @property
+    def body(self) -> bytes:
+        """HTML of the page encoded with `self.encoding`."""
+        if self._body is not None:
+            return self._body
+        return zlib.decompress(self.compressed_body)
+
+    @property
+    def body_id(self) -> str:
+        """
+        Identifier of the body, which doesn't change when the entry is
+        revalidated.
+        """
+        return hashlib.sha1(self.compressed_body).hexdigest()
+
+    def text(self) -> str:
+        """
+        Decodes body of the entry.
+
+        :return: HTML of the page as string.
+        """
+        return self.body.decode(self.encoding, errors="replace")
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """
+        Makes headers for conditional request revalidating the entry.
+
+        :return: Dict with ``If-None-Match`` and ``If-Modified-Since`` headers
+            when the entry has corresponding validators.
+        """
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class HTMLCache:
+    """
+    Persistent cache of raw HTML pages. Pages are stored compressed in
+    `directory` under SHA-256 hash of their canonical URL, so HTML can be
+    parsed again (e.g. after a parser fix) without making requests. Expired
+    pages with ``ETag`` or ``Last-Modified`` validators are revalidated with
+    conditional requests, so unchanged pages aren't transferred again. Cache
+    is safe to use from multiple threads and processes. Methods taking URL
+    accept also URLs relative to procyclingstats, e.g.
+    ``rider/tadej-pogacar``.
+
+    Usage:
+
+    >>> from procyclingstats import HTMLCache, Rider, set_cache
+    >>> set_cache(HTMLCache(".cache/html"))
+    >>> rider = Rider("rider/tadej-pogacar") # makes request
+    >>> rider = Rider("rider/tadej-pogacar") # loaded from the cache
+
+    :param directory: Directory where pages are stored, created if needed.
+    :param policies: Sequence of ``(pattern, ttl)`` tuples. TTL of the first
+        policy whose regex pattern is found in canonical URL of a page is
+        used. Defaults to None, in that case `season_ttl_policies` with
+        `default_ttl` are used.
+    :param default_ttl: TTL of pages not matching any policy (or without
+        season in URL when using the default policies), None means that they
+        never expire. Defaults to 24 hours.
+    :param compress_level: Zlib compression level, defaults to 6.
+    """
+
+    def __init__(self, directory: str,
+                 policies: Optional[Sequence[Tuple[str, TTL]]] = None,
+                 default_ttl: Optional[float] = 24 * 3600,
+                 compress_level: int = 6) -> None:
+        self.directory = directory
+        if policies is None:
+            policies = season_ttl_policies(default_ttl=default_ttl)
+        self.policies = [(re.compile(pattern), ttl)
+                         for pattern, ttl in policies]
+        self.default_ttl = default_ttl
+        self.compress_level = compress_level
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "revalidated": 0,
+            "refetched": 0
+        }
+        os.makedirs(directory, exist_ok=True)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(directory='{self.directory}')"
+
+    def ttl(self, url: str) -> Optional[float]:
+        """
+        Finds TTL of given URL based on cache policies.
+
+        :param url: URL to find TTL for.
+        :return: TTL in seconds, None when page never expires.
+        """
+        url = _cache_url(url)
+        for pattern, ttl in self.policies:
+            match = pattern.search(url)
+            if match:
+                return ttl(match) if callable(ttl) else ttl
+        return self.default_ttl
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        """
+        Loads cached page of given URL, either fresh or expired one. Doesn't
+        update cache counters.
+
+        :param url: URL of the page.
+        :return: Cached entry, None when page isn't cached or its file is
+            corrupted (the file is removed then).
+        """
+        try:
+            with open(self._path(url), "rb") as file:
+                data = file.read()
+        except OSError:
+            return None
+        try:
+            header, compressed_body = data.split(b"\n", 1)
+            meta = json.loads(header)
+            # body is decompressed here, so truncated file is a miss too
+            entry = CacheEntry(meta['url'], compressed_body, meta['encoding'],
+                               float(meta['fetched_at']), meta.get('etag'),
+                               meta.get('last_modified'),
+                               body=zlib.decompress(compressed_body))
+        except (ValueError, KeyError, TypeError, zlib.error):
+            self.delete(url)
+            return None
+        ttl = self.ttl(entry.url)
+        entry.fresh = ttl is None or time.time() - entry.fetched_at < ttl
+        return entry
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """
+        Loads cached page of given URL and updates cache counters. Expired
+        entry is returned too, check its `fresh` attribute before using it.
+
+        :param url: URL of the page.
+        :return: Cached entry, None when page isn't cached.
+        """
+        entry = self.lookup(url)
+        if entry is None:
+            self._count("misses")
+        elif entry.fresh:
+            self._count("hits")
+        return entry
+
+    def revalidate(self, entry: CacheEntry) -> CacheEntry:
+        """
+        Marks expired entry as fresh again, should be called when server
+        responded to conditional request that the page hasn't changed.
+
+        :param entry: Entry to revalidate.
+        :return: Revalidated entry.
+        """
+        entry.fetched_at = time.time()
+        entry.fresh = True
+        self._write(entry)
+        self._count("revalidated")
+        return entry
+
+    def store(self, url: str, html: Union[str, bytes],
+              encoding: str = "utf-8", etag: Optional[str] = None,
+              last_modified: Optional[str] = None,
+              replaces: Optional[CacheEntry] = None) -> CacheEntry:
+        """
+        Stores page of given URL to the cache.
+
+        :param url: URL of the page.
+        :param html: HTML of the page.
+        :param encoding: Encoding of the HTML when given as bytes, defaults
+            to ``utf-8``.
+        :param etag: ETag header of the response, defaults to None.
+        :param last_modified: Last-Modified header of the response, defaults
+            to None.
+        :param replaces: Expired entry of the page that was fetched again,
+            defaults to None.
+        :return: Stored cache entry.
+        """
+        if isinstance(html, str):
+            html = html.encode(encoding)
+        entry = CacheEntry(_cache_url(url),
+                           zlib.compress(html, self.compress_level), encoding,
+                           time.time(), etag, last_modified)
+        self._write(entry)
+        if replaces is not None:
+            self._count("refetched")
+        return entry
+
+    def delete(self, url: str) -> None:
+        """
+        Removes page of given URL from the cache.
+
+        :param url: URL of the page.
+        """
+        try:
+            os.remove(self._path(url))
+        except FileNotFoundError:
+            pass
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Gets cache counters.
+
+        :return: Dict with keys ``hits`` (fresh pages loaded from the cache),
+            ``misses`` (pages that weren't cached), ``revalidated`` (expired
+            pages that haven't changed) and ``refetched`` (expired pages that
+            were transferred again).
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._stats[counter] += 1
+
+    def _write(self, entry: CacheEntry) -> None:
+        """
+        Writes entry to its file atomically. File consists of JSON header
+        with metadata on the first line followed by compressed body, so
+        revalidated entry is written without compressing the body again.
+
+        :param entry: Entry to write.
+        """
+        header = json.dumps({
+            "url": entry.url,
+            "encoding": entry.encoding,
+            "fetched_at": entry.fetched_at,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified
+        }).encode()
+        path = self._path(entry.url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # write to temporary file first, so readers never see partial file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(header + b"\n" + entry.compressed_body)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def _path(self, url: str) -> str:
+        """
+        Makes path of the file where page of given URL is stored.
+
+        :param url: URL of the page.
+        :return: Path to the file.
+        """
+        key = hashlib.sha256(_cache_url(url).encode()).hexdigest()
+        return os.path.join(self.directory, key[:2], f"{key}.z")
+
+
+_default_cache: Optional[HTMLCache] = None
+
+
+def get_cache() -> Optional[HTMLCache]:
+    """
+    Gets HTML cache used by scraper objects that weren't given their own
+    cache.
+
+    :return: Default cache, None when caching is disabled (default).
+    """
+    return _default_cache
+
+
+def set_cache(cache: Optional[HTMLCache]) -> None:
+    """
+    Sets HTML cache used by scraper objects that weren't given their own
+    cache.
+
+    :param cache: Cache to use by default, None disables caching.
+    """
+    global _default_cache # pylint: disable=global-statement
+    _default_cache = cache
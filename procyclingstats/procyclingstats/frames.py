@@ -0,0 +1,154 @@
+import importlib
+from types import ModuleType
+from typing import (TYPE_CHECKING, Any, Dict, Iterable, List, Optional,
+                    Union)
+
+from .utils import table_to_columns, time_to_seconds
+
+if TYPE_CHECKING:
+    import pandas
+    import pyarrow
+
+CATEGORICAL_FIELDS = frozenset((
+    "nationality",
+    "nation_name",
+    "nation_url",
+    "team_name",
+    "team_url",
+    "class",
+    "status",
+    "profile_icon",
+    "bike",
+    "groupset",
+    "wheels"
+))
+"""Table fields with repeated string values, converted to categoricals."""
+
+DURATION_FIELDS = frozenset(("time", "time_seconds", "bonus"))
+"""
+Table fields with times in `H:MM:SS` format or in seconds, converted to
+durations.
+"""
+
+Table = Union[List[Dict[str, Any]], Dict[str, List[Any]]]
+"""Output of table parsing method, either list of dicts or dict of lists."""
+
+
+def to_frame(table: Table, categorical: Iterable[str] = CATEGORICAL_FIELDS
+             ) -> "pandas.DataFrame":
+    """
+    Converts output of table parsing method to pandas DataFrame. Pass output
+    of the method called with `as_columns=True`, so no dict is created for
+    every row. Times are converted to timedeltas, integer columns with missing
+    values to nullable integers.
+
+    Usage:
+
+    >>> from procyclingstats import Stage, to_frame
+    >>> stage = Stage("race/tour-de-france/2022/stage-18")
+    >>> df = to_frame(stage.results("rank", "rider_name", "team_name",
+    ...                             "time", as_columns=True))
+
+    :param table: Parsed table, either dict of lists or list of dicts.
+    :param categorical: Fields to convert to categoricals, defaults to
+        `CATEGORICAL_FIELDS`.
+    :raises ImportError: When pandas isn't installed.
+    :return: DataFrame with column for every field of the table.
+    """
+    pd = _import_optional("pandas")
+    categorical = frozenset(categorical)
+    data = {}
+    for field, values in _table_columns(table).items():
+        if field in DURATION_FIELDS:
+            data[field] = pd.to_timedelta(_durations(values), unit="s")
+        elif field in categorical:
+            data[field] = pd.Categorical(values)
+        elif None in values and _integers(values):
+            data[field] = pd.array(values, dtype="Int64")
+        else:
+            data[field] = values
+    return pd.DataFrame(data)
+
+
+def to_arrow(table: Table, categorical: Iterable[str] = CATEGORICAL_FIELDS
+             ) -> "pyarrow.Table":
+    """
+    Converts output of table parsing method to Arrow table. Pass output of
+    the method called with `as_columns=True`, so no dict is created for every
+    row. Times are converted to durations in seconds, categorical fields are
+    dictionary encoded and missing values are nulls.
+
+    :param table: Parsed table, either dict of lists or list of dicts.
+    :param categorical: Fields to dictionary encode, defaults to
+        `CATEGORICAL_FIELDS`.
+    :raises ImportError: When pyarrow isn't installed.
+    :return: Arrow table with column for every field of the table.
+    """
+    pa = _import_optional("pyarrow")
+    categorical = frozenset(categorical)
+    arrays = {}
+    for field, values in _table_columns(table).items():
+        if field in DURATION_FIELDS:
+            arrays[field] = pa.array(_durations(values), type=pa.duration("s"))
+        elif field in categorical:
+            arrays[field] = pa.array(values).dictionary_encode()
+        else:
+            arrays[field] = pa.array(values)
+    return pa.table(arrays)
+
+
+def _import_optional(name: str) -> ModuleType:
+    """
+    Imports optional dependency.
+
+    :param name: Name of the module to import.
+    :raises ImportError: When the module isn't installed.
+    :return: Imported module.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        raise ImportError(f"'{name}' package is needed for the conversion, " +
+                          f"install it with 'pip install {name}'") from e
+
+
+def _table_columns(table: Table) -> Dict[str, List[Any]]:
+    """
+    Gets columns of given table.
+
+    :param table: Table either as dict of lists or as list of dicts.
+    :return: Dict of lists.
+    """
+    if isinstance(table, dict):
+        return table
+    return table_to_columns(table)
+
+
+def _durations(values: List[Any]) -> List[Optional[int]]:
+    """
+    Converts times to seconds, integer values are already in seconds.
+
+    :param values: Times in `H:MM:SS` format, integers or None.
+    :return: List of seconds, None where the time is missing.
+    """
+    seconds = []
+    for value in values:
+        if value is None or value == "":
+            seconds.append(None)
+        elif isinstance(value, str):
+            seconds.append(time_to_seconds(value))
+        else:
+            seconds.append(int(value))
+    return seconds
+
+
+def _integers(values: List[Any]) -> bool:
+    """
+    Checks whether all values are integers or None.
+
+    :param values: Values to check.
+    :return: True when there are only integers and None values.
+    """
+    return all(value is None or
+               (isinstance(value, int) and not isinstance(value, bool))
+               for value in values)
@@ -1,20 +1,83 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+
+from selectolax.parser import HTMLParser
+
+from .cache import HTMLCache
 from .scraper import Scraper
+from .session import HTTPSession
+
+SECTIONS = {
+    'teams': 'nation.php?season={year}&filter=Filter&id={name}&c=me&p=overview&s=teams',
+    'riders': 'nation.php?season={year}&level=wt&filter=Filter&id={name}&c=me&p=overview&s=contract-riders',
+    'wins': 'nation.php?season={year}&level=1&plevel=smallerorequal&prowin=0&pprowin=largerorequal&filter=Filter&id={name}&c=me&p=overview&s=nation-wins',
+    'pcs_points': 'nation.php?date={year}-12-31&filter=Filter&id={name}&c=me&p=overview&s=pcs-ranking'
+}
+"""Relative URLs of nation overview sections, one per parsing method."""
+
+
+class _SectionPage(Scraper):
+    """Page of one nation overview section, its URL is already absolute."""
+    BASE_URL = ''
+
 
 class Nation(Scraper):
-    def __init__(self, year: int, nation_url: str):
-        super().__init__('???', update_html=False)
+    """
+    Scraper of nation overview. Every parsing method needs different section
+    page, pages are requested on first access (or all at once concurrently
+    by `prefetch`) and memoized, so repeated calls don't make requests. The
+    object can be used from multiple threads.
+    """
+    _public_nonparsing_methods = (*Scraper._public_nonparsing_methods,
+                                  'prefetch')
+
+    def __init__(self, year: int, nation_url: str,
+                 session: Optional[HTTPSession] = None,
+                 cache: Optional[HTMLCache] = None):
+        super().__init__('???', update_html=False, session=session,
+                         cache=cache)
         self.year = year
         self.nation_url = nation_url
+        self._sections: Dict[str, HTMLParser] = {}
+        self._section_locks = {section: threading.Lock()
+                               for section in SECTIONS}
+
+    def update_html(self) -> None:
+        """
+        Drops memoized section pages and requests all of them again
+        concurrently.
+        """
+        # every page is dropped under its lock, so page that is being
+        # requested at the same time is dropped only after it's stored
+        for section, lock in self._section_locks.items():
+            with lock:
+                self._sections.pop(section, None)
+        self.prefetch()
+
+    def prefetch(self, sections: Optional[Iterable[str]] = None,
+                 max_workers: int = 4) -> None:
+        """
+        Requests section pages that weren't requested yet concurrently.
+
+        :param sections: Names of sections (keys of `SECTIONS`) to request,
+            defaults to None (all sections).
+        :param max_workers: Maximum count of requests made at once, defaults
+            to 4.
+        """
+        if sections is None:
+            sections = SECTIONS
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(self._section_html, sections))
 
     def name(self):
         return self.nation_url.split('/')[1]
 
     def teams(self):
-        self._url = self._make_url_absolute(f'nation.php?season={self.year}&filter=Filter&id={self.name()}&c=me&p=overview&s=teams')
-        self.update_html()
+        html = self._section_html('teams')
 
         teams = []
-        html_table = self.html.css_first('span.table-cont > table')
+        html_table = html.css_first('span.table-cont > table')
         for html_tr in html_table.css_first('tbody').css('tr'):
             if html_tr.css('td')[2].text() != 'WT':
                 continue
@@ -22,21 +85,19 @@ class Nation(Scraper):
         return teams
 
     def riders(self):
-        self._url = self._make_url_absolute(f'nation.php?season={self.year}&level=wt&filter=Filter&id={self.name()}&c=me&p=overview&s=contract-riders')
-        self.update_html()
+        html = self._section_html('riders')
 
         riders = []
-        html_table = self.html.css_first('span.table-cont > table')
+        html_table = html.css_first('span.table-cont > table')
         for html_tr in html_table.css_first('tbody').css('tr'):
             riders.append(html_tr.css('td')[1].css_first('a').attributes.get('href'))
         return riders
 
     def wins(self):
-        self._url = self._make_url_absolute(f'nation.php?season={self.year}&level=1&plevel=smallerorequal&prowin=0&pprowin=largerorequal&filter=Filter&id={self.name()}&c=me&p=overview&s=nation-wins')
-        self.update_html()
+        html = self._section_html('wins')
 
         try:
-            text = self.html.css_first('table > tbody > tr > td').text()
+            text = html.css_first('table > tbody > tr > td').text()
             if text.isdigit():
                 return int(text)
         except:
@@ -44,13 +105,30 @@ class Nation(Scraper):
         return 0
 
     def pcs_points(self):
-        self._url = self._make_url_absolute(f'nation.php?date={self.year}-12-31&filter=Filter&id={self.name()}&c=me&p=overview&s=pcs-ranking')
-        self.update_html()
+        html = self._section_html('pcs_points')
 
         try:
-            text = self.html.css_first('tbody > tr.sum').css('td')[4].text()
+            text = html.css_first('tbody > tr.sum').css('td')[4].text()
             if text.isdigit():
                 return int(text)
         except:
             return 0
         return 0
+
+    def _section_html(self, section: str) -> HTMLParser:
+        """
+        Gets HTML of given section page, requests it when it isn't memoized.
+
+        :param section: Name of the section (key of `SECTIONS`).
+        :return: HTML of the section page.
+        """
+        with self._section_locks[section]:
+            html = self._sections.get(section)
+            if html is None:
+                url = self._make_url_absolute(
+                    SECTIONS[section].format(year=self.year, name=self.name()))
+                page = _SectionPage(url, update_html=False,
+                                    session=self._session, cache=self._cache)
+                page.update_html()
+                html = self._sections[section] = page.html
+            return html
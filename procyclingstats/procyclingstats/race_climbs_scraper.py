@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
 from .errors import ExpectedParsingError
 from .scraper import Scraper
@@ -50,7 +50,8 @@ class RaceClimbs(Scraper):
         """
         return self.html.css_first("div.page-content > h2").text() == "Climbs"
 
-    def climbs(self, *args: str) -> List[Dict[str, Any]]:
+    def climbs(self, *args: str, as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Parses race's climbs table from HTML. Note that not allways all info
         about the climbs is present (usually in older races).
@@ -65,6 +66,9 @@ class RaceClimbs(Scraper):
             - top: Height above sea level at the top of the climb in meters.
             - km_before_finnish: KMs to finnish from the top of the climb.
 
+        :param as_columns: Whether to return the table as dict of lists
+            (field to values of all rows) instead of list of dicts, defaults
+            to False.
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
@@ -79,7 +83,7 @@ class RaceClimbs(Scraper):
         fields = parse_table_fields_args(args, available_fields)
         table_html = self.html.css_first("table.basic")
         if table_html.css_first("tbody > tr") is None:
-            return []
+            return self._table_output([], as_columns, fields)
         table_parser = TableParser(table_html)
         casual_fields = [f for f in fields if f in ("climb_name", "climb_url")]
         table_parser.parse(casual_fields)
@@ -96,4 +100,4 @@ class RaceClimbs(Scraper):
             lengths = table_parser.parse_extra_column("Top at KM",
                 lambda x: int(x) if x else None)
             table_parser.extend_table("km_before_finnish", lengths)
-        return table_parser.table
+        return self._table_output(table_parser, as_columns)
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
 from .errors import ExpectedParsingError, UnexpectedParsingError
 from .scraper import Scraper
@@ -126,7 +126,8 @@ class Race(Scraper):
         editions_select_html = self.html.css_first("form > select")
         return parse_select(editions_select_html)
 
-    def stages(self, *args: str) -> List[Dict[str, Any]]:
+    def stages(self, *args: str, as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Parses race stages from HTML (available only on stage races). When
         race is one day race, empty list is returned.
@@ -141,6 +142,9 @@ class Race(Scraper):
             - stage_url: URL of the stage, e.g. \
                 ``race/tour-de-france/2022/stage-2``.
 
+        :param as_columns: Whether to return the table as dict of lists
+            (field to values of all rows) instead of list of dicts, defaults
+            to False.
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
@@ -150,24 +154,17 @@ class Race(Scraper):
             "stage_name",
             "stage_url",
         )
-        if self.is_one_day_race():
-            return []
-
         fields = parse_table_fields_args(args, available_fields)
+        if self.is_one_day_race():
+            return self._table_output([], as_columns, fields)
         stages_table_html = self.html.css_first("div:not(.mg_r2) > div > \
             span > table.basic")
         if not stages_table_html:
-            return []
-        # remove rest day table rows
-        for stage_e in stages_table_html.css("tbody > tr"):
-            not_p_icon = stage_e.css_first(".icon.profile.p")
-            if not_p_icon:
-                stage_e.remove()
-
-        # removes last row from stages table
-        for row in stages_table_html.css("tr.sum"):
-            row.remove()
-        table_parser = TableParser(stages_table_html)
+            return self._table_output([], as_columns, fields)
+        # skip rest day rows and the last row with sum
+        table_parser = TableParser(stages_table_html, row_filter=lambda row:
+            not row.css_first(".icon.profile.p") and
+            "sum" not in (row.attributes.get("class") or "").split())
         casual_f_to_parse = [f for f in fields if f != "date"]
         table_parser.parse(casual_f_to_parse)
 
@@ -175,9 +172,10 @@ class Race(Scraper):
         if "date" in fields:
             dates = table_parser.parse_extra_column(0, get_day_month)
             table_parser.extend_table("date", dates)
-        return table_parser.table
+        return self._table_output(table_parser, as_columns)
     
-    def stages_winners(self, *args) -> List[Dict[str, str]]:
+    def stages_winners(self, *args: str, as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Parses stages winners from HTML (available only on stage races). When
         race is one day race, empty list is returned.
@@ -190,6 +188,9 @@ class Race(Scraper):
             - rider_url: Wineer's URL.
             - nationality: Winner's nationality as 2 chars long country code.
 
+        :param as_columns: Whether to return the table as dict of lists
+            (field to values of all rows) instead of list of dicts, defaults
+            to False.
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
@@ -199,21 +200,17 @@ class Race(Scraper):
             "rider_url",
             "nationality",
         )
-        if self.is_one_day_race():
-            return []
-
         fields = parse_table_fields_args(args, available_fields)
+        if self.is_one_day_race():
+            return self._table_output([], as_columns, fields)
         orig_fields = fields
         winners_html = self.html.css("div:not(.mg_r2) > div > \
             span > table.basic")[1]
         if not winners_html:
-            return []
-        # remove rest day table rows
-        for stage_e in winners_html.css("tbody > tr"):
-            stage_name = stage_e.css_first("td").text()
-            if not stage_name:
-                stage_e.remove()
-        table_parser = TableParser(winners_html)
+            return self._table_output([], as_columns, fields)
+        # skip rest day rows
+        table_parser = TableParser(winners_html,
+            row_filter=lambda row: bool(row.css_first("td").text()))
     
         casual_f_to_parse = [f for f in fields if f != "stage_name"]
         try:
@@ -242,4 +239,4 @@ class Race(Scraper):
                 table_parser.parse_extra_column(0, str) if val]
             table_parser.extend_table("stage_name", stage_names)
                     
-        return table_parser.table
+        return self._table_output(table_parser, as_columns)
@@ -1,8 +1,11 @@
-from typing import Any, Dict, List
+import sys
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from selectolax.parser import Node
 
 from .scraper import Scraper
 from .table_parser import TableParser
-from .utils import parse_table_fields_args
+from .utils import flag_nationality, parse_table_fields_args
 
 
 class RaceStartlist(Scraper):
@@ -40,7 +43,9 @@ class RaceStartlist(Scraper):
         ]
     }
     """
-    def startlist(self, *args: str) -> List[Dict[str, Any]]:
+    def startlist(self, *args: str, as_columns: bool = False,
+            intern_teams: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Parses startlist from HTML. When startlist is individual (without
         teams) fields team name, team url and rider nationality are set to
@@ -58,6 +63,13 @@ class RaceStartlist(Scraper):
                 numbered participants (e.g. the ones that haven't occured yet)
                 is every rider's ID None.
 
+        :param as_columns: Whether to return the table as dict of lists
+            (field to values of all rows) instead of list of dicts, defaults
+            to False.
+        :param intern_teams: Whether to intern team names and URLs (see
+            `sys.intern`), so all riders of a team share the same string
+            objects with every other startlist parsed in the process and
+            teams can be compared by identity. Defaults to False.
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
@@ -82,41 +94,87 @@ class RaceStartlist(Scraper):
                 numbers = startlist_parser.parse_extra_column(0,
                     lambda x: int(x) if x else None)
                 startlist_parser.extend_table("rider_number", numbers)
-            return startlist_parser.table
+            if intern_teams:
+                for field in ("team_name", "team_url"):
+                    if field in fields:
+                        startlist_parser.extend_table(field, [
+                            sys.intern(value) if value is not None else None
+                            for value in startlist_parser.columns[field]])
+            return self._table_output(startlist_parser, as_columns)
 
-        casual_rider_fields = [
-            "rider_name",
-            "rider_url",
-            "nationality"
-        ]
-        table = []
         startlist_html = self.html.css_first(".startlist_v4")
-        for team_html in startlist_html.css(".ridersCont"):
-            riders_table = team_html.css_first("ul")
-            table_parser = TableParser(riders_table)
-            rider_f_to_parse = [f for f in casual_rider_fields if f in fields]
-            table_parser.parse(rider_f_to_parse)
-            # add rider numbers to the table if needed
-            if "rider_number" in fields:
-                numbers = []
-                for row in riders_table.css("li > .bib"):
-                    num = row.text(deep=False).split(" ")[0]
-                    if num.isnumeric():
-                        numbers.append(int(num))
+        if not startlist_html:
+            return self._table_output([], as_columns, fields)
+        return self._table_output(
+            self._parse_startlist_v4(startlist_html, fields, intern_teams),
+            as_columns)
+
+    @staticmethod
+    def _parse_startlist_v4(startlist_html: Node, fields: List[str],
+                            intern_teams: bool) -> Dict[str, List[Any]]:
+        """
+        Parses startlist with riders grouped by teams in one walk over the
+        startlist elements.
+
+        :param startlist_html: HTML of `.startlist_v4` element.
+        :param fields: Fields to parse, same as `startlist` fields.
+        :param intern_teams: Whether to intern team names and URLs.
+        :return: Startlist as dict of lists.
+        """
+        rider_names: List[Optional[str]] = []
+        rider_urls: List[Optional[str]] = []
+        nationalities: List[Optional[str]] = []
+        numbers: List[Optional[int]] = []
+        teams: List[Tuple[Optional[str], Optional[str]]] = []
+        team: Tuple[Optional[str], Optional[str]] = (None, None)
+        # the first a element of every team container is the team
+        team_expected = False
+        root_id = startlist_html.mem_id
+        for node in startlist_html.traverse():
+            tag = node.tag
+            if tag == "li":
+                # team li elements are children of the startlist, others are
+                # riders of the last team
+                if node.parent.mem_id == root_id: # type: ignore
+                    continue
+                rider_names.append(None)
+                rider_urls.append(None)
+                nationalities.append(None)
+                numbers.append(None)
+                teams.append(team)
+            elif tag == "a":
+                href = node.attributes.get("href") or ""
+                if team_expected:
+                    team_name = node.text()
+                    if intern_teams:
+                        team = (sys.intern(team_name), sys.intern(href))
                     else:
-                        numbers.append(None)
-                table_parser.extend_table("rider_number", numbers)
-            # add team names to the table if needed
-            if "team_name" in fields:
-                team_name = team_html.css_first("a").text()
-                team_names = [team_name for _ in range(
-                    len(table_parser.table))]
-                table_parser.extend_table("team_name", team_names)
-            # add team urls to the table if needed
-            if "team_url" in fields:
-                team_url = team_html.css_first("a").attributes['href']
-                team_urls = [team_url for _ in range(len(table_parser.table))]
-                table_parser.extend_table("team_url", team_urls)
-            # add team table to startlist table
-            table.extend(table_parser.table)
-        return table
+                        team = (team_name, href)
+                    team_expected = False
+                elif (rider_urls and rider_urls[-1] is None and
+                        "rider" in href.split("/")):
+                    rider_urls[-1] = href
+                    rider_names[-1] = node.text()
+            elif tag == "div":
+                if "ridersCont" in (node.attributes.get("class") or ""
+                                    ).split():
+                    team_expected = True
+            elif tag == "span" and numbers:
+                class_attr = node.attributes.get("class")
+                classes = (class_attr or "").split()
+                if "bib" in classes:
+                    number = node.text(deep=False).split(" ")[0]
+                    numbers[-1] = int(number) if number.isnumeric() else None
+                elif "flag" in classes and nationalities[-1] is None:
+                    nationalities[-1] = flag_nationality(class_attr)
+
+        columns = {
+            "rider_name": rider_names,
+            "rider_url": rider_urls,
+            "nationality": nationalities,
+            "rider_number": numbers,
+            "team_name": [team_name for team_name, _ in teams],
+            "team_url": [team_url for _, team_url in teams]
+        }
+        return {field: values for field, values in columns.items()
+                if field in fields}
@@ -1,5 +1,5 @@
 import re
-from typing import Any, Dict, List, Literal, Tuple
+from typing import Any, Dict, List, Literal, Tuple, Union
 
 from .errors import ExpectedParsingError
 from .scraper import Scraper
@@ -60,7 +60,8 @@ class Ranking(Scraper):
         ...
     }
     """
-    def individual_ranking(self, *args: str) -> List[Dict[str, Any]]:
+    def individual_ranking(self, *args: str, as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Parses individual ranking from HTML.
 
@@ -76,6 +77,9 @@ class Ranking(Scraper):
             - nationality: Rider's nationality as 2 chars long country code.
             - points:
 
+        :param as_columns: Whether to return the table as dict of lists
+            (field to values of all rows) instead of list of dicts, defaults
+            to False.
         :raises ExpectedParsingError: When the table from HTML is not an
             individual points ranking table.
         :raises ValueError: When one of args is of invalid value.
@@ -96,9 +100,11 @@ class Ranking(Scraper):
             raise ExpectedParsingError(
                 "This object doesn't support individual_ranking method, create"
                 "one with individual ranking URL to call this method.")
-        return self._parse_regular_ranking_table(args, available_fields)
+        return self._parse_regular_ranking_table(args, available_fields,
+            as_columns)
 
-    def team_ranking(self, *args: str) -> List[Dict[str, Any]]:
+    def team_ranking(self, *args: str, as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Parses team ranking from HTML.
 
@@ -113,6 +119,9 @@ class Ranking(Scraper):
             - class: Team's class, e.g. ``WT``.
             - points:
 
+        :param as_columns: Whether to return the table as dict of lists
+            (field to values of all rows) instead of list of dicts, defaults
+            to False.
         :raises ExpectedParsingError: When the table from HTML is not a team
             points ranking table.
         :raises ValueError: When one of args is of invalid value.
@@ -131,9 +140,11 @@ class Ranking(Scraper):
             raise ExpectedParsingError(
                 "This object doesn't support team_ranking method, "
                 "create one with teams ranking URL to call this method.")
-        return self._parse_regular_ranking_table(args, available_fields)
+        return self._parse_regular_ranking_table(args, available_fields,
+            as_columns)
 
-    def nations_ranking(self, *args: str) -> List[Dict[str, Any]]:
+    def nations_ranking(self, *args: str, as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
 
         """
         Parses nations ranking from HTML.
@@ -148,6 +159,9 @@ class Ranking(Scraper):
             - nationality: Nation as 2 chars long country code.
             - points:
 
+        :param as_columns: Whether to return the table as dict of lists
+            (field to values of all rows) instead of list of dicts, defaults
+            to False.
         :raises ExpectedParsingError: When the table from HTML is not a
             nationality points ranking table.
         :raises ValueError: When one of args is of invalid value.
@@ -166,9 +180,11 @@ class Ranking(Scraper):
             raise ExpectedParsingError(
                 "This object doesn't support nations_ranking method, create" +
                 "one with nations ranking URL to call this method.")
-        return self._parse_regular_ranking_table(args, available_fields)
+        return self._parse_regular_ranking_table(args, available_fields,
+            as_columns)
 
-    def statistics_ranking(self, *args: str) -> List[Dict[str, Any]]:
+    def statistics_ranking(self, *args: str, as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         available_fields = (
             "rank",
             "prev_rank",
@@ -193,9 +209,11 @@ class Ranking(Scraper):
             'wheels',
             'number_of_wins',
         )
-        return self._parse_regular_ranking_table(args, available_fields)
+        return self._parse_regular_ranking_table(args, available_fields,
+            as_columns)
 
-    def races_ranking(self, *args: str) -> List[Dict[str, Any]]:
+    def races_ranking(self, *args: str, as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Parses race ranking from HTML. Race points are evaluated based on
             startlist quality score.
@@ -211,6 +229,9 @@ class Ranking(Scraper):
             - class: Race's class, e.g. ``WT``.
             - points:
 
+        :param as_columns: Whether to return the table as dict of lists
+            (field to values of all rows) instead of list of dicts, defaults
+            to False.
         :raises ExpectedParsingError: When the table from HTML is not a race
             ranking table.
         :raises ValueError: When one of args is of invalid value.
@@ -242,9 +263,10 @@ class Ranking(Scraper):
         table_parser.parse(fields)
         table_parser.rename_field("stage_name", "race_name")
         table_parser.rename_field("stage_url", "race_url")
-        return table_parser.table
+        return self._table_output(table_parser, as_columns)
 
-    def individual_wins_ranking(self, *args: str) -> List[Dict[str, Any]]:
+    def individual_wins_ranking(self, *args: str, as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Parses individual wins ranking from HTML.
 
@@ -262,6 +284,9 @@ class Ranking(Scraper):
             - second_places:
             - third_places:
 
+        :param as_columns: Whether to return the table as dict of lists
+            (field to values of all rows) instead of list of dicts, defaults
+            to False.
         :raises ExpectedParsingError: When the table from HTML is not an
             individual wins ranking table.
         :raises ValueError: When one of args is of invalid value.
@@ -283,9 +308,11 @@ class Ranking(Scraper):
         #     raise ExpectedParsingError(
         #         "This object doesn't support races_ranking method, create one"
         #         "with individual wins ranking URL to call this method.")
-        return self._parse_regular_ranking_table(args, available_fields)
+        return self._parse_regular_ranking_table(args, available_fields,
+            as_columns)
 
-    def teams_wins_ranking(self, *args: str) -> List[Dict[str, Any]]:
+    def teams_wins_ranking(self, *args: str, as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Parses team wins ranking from HTML.
 
@@ -302,6 +329,9 @@ class Ranking(Scraper):
             - second_places:
             - third_places:
 
+        :param as_columns: Whether to return the table as dict of lists
+            (field to values of all rows) instead of list of dicts, defaults
+            to False.
         :raises ExpectedParsingError: When the table from HTML is not a team
             wins ranking.
         :raises ValueError: When one of args is of invalid value.
@@ -322,9 +352,11 @@ class Ranking(Scraper):
             raise ExpectedParsingError(
                 "This object doesn't support teams_wins_ranking method, "
                 "create one with teams wins ranking URL to call this method.")
-        return self._parse_regular_ranking_table(args, available_fields)
+        return self._parse_regular_ranking_table(args, available_fields,
+            as_columns)
 
-    def nations_wins_ranking(self, *args: str) -> List[Dict[str, Any]]:
+    def nations_wins_ranking(self, *args: str, as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Parses nations wins ranking from HTML.
 
@@ -340,6 +372,9 @@ class Ranking(Scraper):
             - second_places:
             - third_places:
 
+        :param as_columns: Whether to return the table as dict of lists
+            (field to values of all rows) instead of list of dicts, defaults
+            to False.
         :raises ExpectedParsingError: When the table from HTML is not a nation
             wins ranking table.
         :raises ValueError: When one of args is of invalid value.
@@ -361,9 +396,11 @@ class Ranking(Scraper):
                 "This object doesn't support nations_wins_ranking method, " +
                 "create one with nations wins ranking URL to call this" +
                 "method.")
-        return self._parse_regular_ranking_table(args, available_fields)
+        return self._parse_regular_ranking_table(args, available_fields,
+            as_columns)
 
-    def distance_ranking(self, *args: str) -> List[Dict[str, Any]]:
+    def distance_ranking(self, *args: str, as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Parses ranking with riders ridden distances from HTML.
 
@@ -378,6 +415,9 @@ class Ranking(Scraper):
             - nationality: Rider's nationality as 2 chars long country code.
             - distance: Rider's ridden distance in the season as KMs.
 
+        :param as_columns: Whether to return the table as dict of lists
+            (field to values of all rows) instead of list of dicts, defaults
+            to False.
         :raises ExpectedParsingError: When the table from HTML is not a
             distance ranking table.
         :raises ValueError: When one of args is of invalid value.
@@ -408,9 +448,10 @@ class Ranking(Scraper):
             distances = table_parser.parse_extra_column("KMs",
                 lambda x: int(x) if x else 0)
             table_parser.extend_table("distance", distances)
-        return table_parser.table
+        return self._table_output(table_parser, as_columns)
 
-    def racedays_ranking(self, *args: str) -> List[Dict[str, Any]]:
+    def racedays_ranking(self, *args: str, as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Parses ranking with riders ridden racedays from HTML.
 
@@ -425,6 +466,9 @@ class Ranking(Scraper):
             - nationality: Rider's nationality as 2 chars long country code.
             - racedays: Rider's ridden racedays in the season.
 
+        :param as_columns: Whether to return the table as dict of lists
+            (field to values of all rows) instead of list of dicts, defaults
+            to False.
         :raises ExpectedParsingError: When the table from HTML is not a
             racedays ranking table.
         :raises ValueError: When one of args is of invalid value.
@@ -455,7 +499,7 @@ class Ranking(Scraper):
             racedays = table_parser.parse_extra_column("Racedays",
                 lambda x: int(x) if x else 0)
             table_parser.extend_table("racedays", racedays)
-        return table_parser.table
+        return self._table_output(table_parser, as_columns)
 
     def dates_select(self) -> List[Dict[str, str]]:
         """
@@ -542,17 +586,21 @@ class Ranking(Scraper):
 
     def _parse_regular_ranking_table(self,
             args: Tuple[str, ...],
-            available_fields: Tuple[str, ...]) -> List[Dict[str, Any]]:
+            available_fields: Tuple[str, ...],
+            as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Does general ranking parsing procedure using TableParser.
 
         :param args: Parsing method args (only the ones that
             `TableParser.parse` method is able to parse).
         :param available_fields: Available table fields for parsing method
+        :param as_columns: Whether to return the table as dict of lists,
+            defaults to False.
         :return: Table with wanted fields.
         """
         fields = parse_table_fields_args(args, available_fields)
         html_table = self.html.css_first("table")
         table_parser = TableParser(html_table)
         table_parser.parse(fields)
-        return table_parser.table
+        return self._table_output(table_parser, as_columns)
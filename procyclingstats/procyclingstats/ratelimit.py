@@ -0,0 +1,250 @@
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Dict, Optional
+
+THROTTLED_PAGE_TEXT = ("Due to technical difficulties this page is " +
+                       "temporarily unavailable.")
+"""Text of the page that procyclingstats returns when it's overloaded."""
+
+
+class RateLimiter:
+    """
+    Adaptive rate limiter shared by all threads and asyncio tasks making
+    requests. Requests are limited by a token bucket and by a concurrency
+    limit. Both are adapted using AIMD (additive increase, multiplicative
+    decrease): every successful response increases them slightly and every
+    throttled response (HTTP 429, 5xx or procyclingstats "technical
+    difficulties" page) decreases them, so throughput settles at the highest
+    rate the site tolerates. Throttled requests are retried after exponential
+    backoff with full jitter.
+
+    :param rate: Initial count of requests per second, defaults to 5.
+    :param max_rate: Maximum count of requests per second, defaults to 20.
+    :param min_rate: Minimum count of requests per second, defaults to 0.2.
+    :param burst: Capacity of the token bucket, defaults to 5.
+    :param concurrency: Initial count of requests made at once, defaults
+        to 4.
+    :param max_concurrency: Maximum count of requests made at once, defaults
+        to 16.
+    :param decrease: Factor by which rate and concurrency are multiplied on
+        throttled response, defaults to 0.5.
+    :param cooldown: Minimal count of seconds between two decreases, so
+        responses to requests that were already in flight don't decrease the
+        limits repeatedly. Defaults to 1.
+    :param max_retries: Maximal count of retries of throttled request,
+        defaults to 5.
+    :param backoff_base: Base of the exponential backoff in seconds,
+        defaults to 1.
+    :param backoff_max: Maximal backoff in seconds, defaults to 60.
+    """
+
+    def __init__(self, rate: float = 5, max_rate: float = 20,
+                 min_rate: float = 0.2, burst: float = 5,
+                 concurrency: float = 4, max_concurrency: float = 16,
+                 decrease: float = 0.5, cooldown: float = 1,
+                 max_retries: int = 5, backoff_base: float = 1,
+                 backoff_max: float = 60) -> None:
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._rate = rate
+        self._concurrency = concurrency
+        self._tokens = burst
+        self._updated_at = time.monotonic()
+        self._decreased_at = float("-inf")
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        self._stats = {
+            "requests": 0,
+            "throttled": 0,
+            "retries": 0
+        }
+
+    @classmethod
+    def without_pacing(cls, max_retries: int = 5) -> "RateLimiter":
+        """
+        Creates rate limiter which neither limits nor delays requests, but
+        still retries throttled ones. Should be used when replaying responses
+        with `ReplaySession`, so recorded throttled responses are retried the
+        same way as when they were recorded.
+
+        :param max_retries: Maximal count of retries of throttled request,
+            defaults to 5.
+        :return: Rate limiter without pacing.
+        """
+        unlimited = 1e9
+        return cls(rate=unlimited, max_rate=unlimited, min_rate=unlimited,
+                   burst=unlimited, concurrency=unlimited,
+                   max_concurrency=unlimited, decrease=1,
+                   max_retries=max_retries, backoff_max=0)
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}(rate={self._rate:.2f}, " +
+                f"concurrency={int(self._concurrency)})")
+
+    @property
+    def rate(self) -> float:
+        """Current count of requests per second."""
+        return self._rate
+
+    @property
+    def concurrency(self) -> int:
+        """Current count of requests that can be made at once."""
+        return max(int(self._concurrency), 1)
+
+    def acquire(self) -> None:
+        """
+        Blocks until request can be made. Every call has to be followed by
+        `release` call after the response is received.
+        """
+        with self._condition:
+            while True:
+                wait = self._try_acquire()
+                if wait is None:
+                    return
+                self._condition.wait(wait)
+
+    async def aacquire(self) -> None:
+        """
+        Asynchronous variant of `acquire`, waits without blocking the event
+        loop.
+        """
+        while True:
+            with self._condition:
+                wait = self._try_acquire()
+            if wait is None:
+                return
+            # concurrency slot might be released by another thread, so the
+            # waiting is done in short steps
+            await asyncio.sleep(min(wait, 0.05))
+
+    def release(self, throttled: bool = False, adapt: bool = True) -> None:
+        """
+        Releases concurrency slot taken by `acquire` and adapts limits.
+
+        :param throttled: Whether the response was throttled, defaults to
+            False.
+        :param adapt: Whether to adapt limits, defaults to True. Should be
+            False when no response was received (e.g. the request timed out),
+            so failing requests don't raise the limits.
+        """
+        with self._condition:
+            self._in_flight -= 1
+            self._stats['requests'] += 1
+            now = time.monotonic()
+            if throttled and adapt:
+                self._stats['throttled'] += 1
+                if now - self._decreased_at >= self.cooldown:
+                    self._decreased_at = now
+                    self._rate = max(self._rate * self.decrease,
+                                     self.min_rate)
+                    self._concurrency = max(
+                        self._concurrency * self.decrease, 1)
+            elif adapt:
+                self._rate = min(self._rate + 1 / self._rate, self.max_rate)
+                self._concurrency = min(
+                    self._concurrency + 1 / self._concurrency,
+                    self.max_concurrency)
+            self._condition.notify_all()
+
+    def is_throttled(self, response: Any) -> bool:
+        """
+        Checks whether given response means that the site is overloaded.
+
+        :param response: Response object.
+        :return: True when status code is 429 or 5xx, or the response is the
+            "technical difficulties" page, otherwise False.
+        """
+        if response.status_code == 429 or response.status_code >= 500:
+            return True
+        content = getattr(response, "content", None)
+        if content is None:
+            return THROTTLED_PAGE_TEXT in response.text
+        return THROTTLED_PAGE_TEXT.encode() in content
+
+    def backoff(self, attempt: int, response: Any = None) -> float:
+        """
+        Computes time to wait before retrying throttled request using
+        exponential backoff with full jitter.
+
+        :param attempt: Count of already made retries.
+        :param response: Throttled response, defaults to None. When it has
+            ``Retry-After`` header with seconds, at least that long is waited.
+        :return: Seconds to wait.
+        """
+        with self._condition:
+            self._stats['retries'] += 1
+        delay = random.uniform(
+            0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        retry_after = None
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, min(float(retry_after), self.backoff_max))
+        return delay
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Gets limiter counters and current limits.
+
+        :return: Dict with keys ``requests`` (finished requests),
+            ``throttled`` (throttled responses), ``retries``, ``rate`` and
+            ``concurrency``.
+        """
+        with self._condition:
+            return {
+                **self._stats,
+                "rate": self._rate,
+                "concurrency": self.concurrency
+            }
+
+    def _try_acquire(self) -> Optional[float]:
+        """
+        Takes token and concurrency slot if available. Has to be called with
+        `self._condition` locked.
+
+        :return: None when acquired, otherwise seconds to wait before next
+            try.
+        """
+        now = time.monotonic()
+        self._tokens = min(self._tokens +
+                           (now - self._updated_at) * self._rate, self.burst)
+        self._updated_at = now
+        if self._in_flight >= self.concurrency:
+            return 1 / self._rate
+        if self._tokens < 1:
+            return (1 - self._tokens) / self._rate
+        self._tokens -= 1
+        self._in_flight += 1
+        return None
+
+
+_default_rate_limiter: Optional[RateLimiter] = None
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """
+    Gets rate limiter used by all scraper objects.
+
+    :return: Rate limiter, None when requests aren't limited (default).
+    """
+    return _default_rate_limiter
+
+
+def set_rate_limiter(rate_limiter: Optional[RateLimiter]) -> None:
+    """
+    Sets rate limiter used by all scraper objects.
+
+    :param rate_limiter: Rate limiter to use, None disables limiting.
+    """
+    global _default_rate_limiter # pylint: disable=global-statement
+    _default_rate_limiter = rate_limiter
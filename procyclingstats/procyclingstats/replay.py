@@ -0,0 +1,197 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import zipfile
+from typing import Any, Dict, List
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .session import HTTPSession
+from .utils import canonical_url
+
+RECORDED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Retry-After")
+"""Response headers that are stored to the archive."""
+
+
+class ReplayResponse:
+    """
+    Response replayed from an archive, has attributes of `requests.Response`
+    object that are needed by scrapers.
+
+    :param url: URL of the request.
+    :param status_code: Status code of the response.
+    :param headers: Headers of the response.
+    :param content: Raw body of the response.
+    :param elapsed: Seconds it took to receive the response when recording.
+    """
+
+    def __init__(self, url: str, status_code: int, headers: Dict[str, str],
+                 content: bytes, elapsed: float) -> None:
+        self.url = url
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+        self.elapsed = elapsed
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} [{self.status_code}]>"
+
+    @property
+    def text(self) -> str:
+        """Body of the response decoded as UTF-8."""
+        return self.content.decode("utf-8", errors="replace")
+
+
+class RecordingSession(HTTPSession):
+    """
+    Session that makes requests like `HTTPSession` and records every response
+    to a ZIP archive that can be replayed later by `ReplaySession`. Bodies are
+    stored compressed and deduplicated. The archive is written by `save` (or
+    `close`).
+
+    Usage:
+
+    >>> from procyclingstats import RecordingSession, Rider, set_session
+    >>> session = RecordingSession("run.zip")
+    >>> set_session(session)
+    >>> rider = Rider("rider/tadej-pogacar")
+    >>> session.save()
+
+    :param archive: Path of the archive to write.
+    :param kwargs: Keyword arguments passed to `HTTPSession` constructor.
+    """
+
+    def __init__(self, archive: str, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.archive = archive
+        self._records_lock = threading.Lock()
+        self._responses: Dict[str, List[Dict[str, Any]]] = {}
+        self._bodies: Dict[str, bytes] = {}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(archive='{self.archive}')"
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        start = time.perf_counter()
+        response = super().get(url, **kwargs)
+        elapsed = time.perf_counter() - start
+        body_name = hashlib.sha1(response.content).hexdigest()
+        record = {
+            "status_code": response.status_code,
+            "headers": {header: response.headers[header]
+                        for header in RECORDED_HEADERS
+                        if header in response.headers},
+            "body": body_name,
+            "elapsed": round(elapsed, 4)
+        }
+        with self._records_lock:
+            self._bodies[body_name] = response.content
+            self._responses.setdefault(canonical_url(url), []).append(record)
+        return response
+
+    def save(self) -> None:
+        """Writes all recorded responses to the archive."""
+        with self._records_lock:
+            index = json.dumps({"version": 1, "responses": self._responses},
+                               indent=1, sort_keys=True)
+            bodies = dict(self._bodies)
+        directory = os.path.dirname(os.path.abspath(self.archive))
+        fd, tmp_path = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as file, zipfile.ZipFile(
+                    file, "w", zipfile.ZIP_DEFLATED) as archive:
+                archive.writestr("index.json", index)
+                for body_name in sorted(bodies):
+                    archive.writestr(f"bodies/{body_name}", bodies[body_name])
+            os.replace(tmp_path, self.archive)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def close(self) -> None:
+        """Writes the archive and closes all pooled connections."""
+        self.save()
+        super().close()
+
+
+class ReplaySession(HTTPSession):
+    """
+    Session that doesn't make any requests and returns responses recorded by
+    `RecordingSession` instead, so loaders can be run and benchmarked
+    repeatably without network. Responses of the same URL are replayed in the
+    order they were recorded, the last one is repeated when there are no more
+    responses. For asynchronous usage wrap the session in
+    `ThreadedTransport`. Throttled responses that were retried when recording
+    are recorded too, set rate limiter created by `RateLimiter.without_pacing`
+    to retry them again when replaying.
+
+    :param archive: Path of the archive to replay.
+    :param emulate_latency: Whether to wait as long as it took to receive the
+        response when recording, defaults to False. When False, only parsing
+        and pipeline time is measured.
+    :param latency_scale: Factor by which the recorded latency is multiplied
+        when emulating it, defaults to 1.
+    """
+
+    def __init__(self, archive: str, emulate_latency: bool = False,
+                 latency_scale: float = 1) -> None:
+        # `requests` session of `HTTPSession` is created on the first request
+        # made through it, replay session never makes one so it isn't created
+        super().__init__()
+        self.archive = archive
+        self.emulate_latency = emulate_latency
+        self.latency_scale = latency_scale
+        self._replay_lock = threading.Lock()
+        self._replayed: Dict[str, int] = {}
+        with zipfile.ZipFile(archive) as zip_archive:
+            index = json.loads(zip_archive.read("index.json"))
+            self._bodies = {name.split("/", 1)[1]: zip_archive.read(name)
+                            for name in zip_archive.namelist()
+                            if name.startswith("bodies/")}
+        self._responses: Dict[str, List[Dict[str, Any]]] = index['responses']
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}(archive='{self.archive}', " +
+                f"emulate_latency={self.emulate_latency})")
+
+    def get(self, url: str, **kwargs: Any) -> ReplayResponse:
+        """
+        Replays response to GET request to given URL.
+
+        :param url: Absolute URL of the request.
+        :param kwargs: Keyword arguments of the request, ignored.
+        :raises requests.ConnectionError: When no response of the URL was
+            recorded.
+        :return: Replayed response.
+        """
+        key = canonical_url(url)
+        records = self._responses.get(key)
+        if not records:
+            raise requests.ConnectionError(
+                f"Response of '{url}' wasn't recorded in '{self.archive}'")
+        with self._replay_lock:
+            self._requests_count += 1
+            i = self._replayed.get(key, 0)
+            self._replayed[key] = i + 1
+        record = records[min(i, len(records) - 1)]
+        if self.emulate_latency:
+            time.sleep(record['elapsed'] * self.latency_scale)
+        return ReplayResponse(url, record['status_code'], record['headers'],
+                              self._bodies[record['body']], record['elapsed'])
+
+    def stats(self) -> Dict[str, int]:
+        with self._replay_lock:
+            return {
+                "requests": self._requests_count,
+                "connections": 0,
+                "reused": 0
+            }
+
+    def rewind(self) -> None:
+        """Starts replaying responses of every URL from the first one again."""
+        with self._replay_lock:
+            self._replayed = {}
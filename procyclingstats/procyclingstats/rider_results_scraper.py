@@ -1,4 +1,6 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
+
+from selectolax.parser import Node
 
 from .errors import ExpectedParsingError
 from .scraper import Scraper
@@ -67,16 +69,19 @@ class RiderResults(Scraper):
         except AssertionError:
             return False
 
-    def _set_up_html(self):
-        """Overrides Scraper method. Removes last table row with sum stats."""
-        results_table_html = self.html.css_first("table")
-        if not results_table_html:
-            return
-        for row in results_table_html.css("tr"):
-            if "class" in row.attributes and row.attributes['class'] == "sum":
-                row.decompose()
+    @staticmethod
+    def _is_result_row(row: Node) -> bool:
+        """
+        Checks whether given table row is a result, the last row with sum
+        stats isn't.
 
-    def results(self, *args: str) -> List[Dict[str, Any]]:
+        :param row: Table row HTML.
+        :return: Whether the row is a result.
+        """
+        return row.attributes.get("class") != "sum"
+
+    def results(self, *args: str, as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Parses general rider's results table from HTML.
 
@@ -93,6 +98,9 @@ class RiderResults(Scraper):
             - pcs_points:
             - uci_points:
 
+        :param as_columns: Whether to return the table as dict of lists
+            (field to values of all rows) instead of list of dicts, defaults
+            to False.
         :raises ExpecterParsingError: When the table from HTML isn't a results
             table.
         :raises ValueError: When one of args is of invalid value.
@@ -117,11 +125,13 @@ class RiderResults(Scraper):
 
         fields = parse_table_fields_args(args, available_fields)
         results_table_html = self.html.css_first("table")
-        table_parser = TableParser(results_table_html)
+        table_parser = TableParser(results_table_html,
+                                   row_filter=self._is_result_row)
         table_parser.parse(fields)
-        return table_parser.table
+        return self._table_output(table_parser, as_columns)
 
-    def final_n_km_results(self, *args: str) -> List[Dict[str, Any]]:
+    def final_n_km_results(self, *args: str, as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Parses rider's final n KMs results table from HTML.
 
@@ -137,6 +147,9 @@ class RiderResults(Scraper):
             - vertical_meters: Vertical meters gained in final n KMs.
             - average_percentage: Average percentage of last n KMs.
 
+        :param as_columns: Whether to return the table as dict of lists
+            (field to values of all rows) instead of list of dicts, defaults
+            to False.
         :raises ExpecterParsingError: When the table from HTML isn't a final n
             KMs results table.
         :raises ValueError: When one of args is of invalid value.
@@ -174,7 +187,7 @@ class RiderResults(Scraper):
         if "average_percentage" in fields:
             percentages = table_parser.parse_extra_column("Avg. %", float)
             table_parser.extend_table("average_percentage", percentages)
-        return table_parser.table
+        return self._table_output(table_parser, as_columns)
 
     def seasons_select(self) -> List[Dict[str, str]]:
         """
@@ -1,5 +1,5 @@
 import calendar
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from .scraper import Scraper
 from .table_parser import TableParser
@@ -30,6 +30,21 @@ class Rider(Scraper):
         ...
     }
     """
+    _public_nonparsing_methods = (*Scraper._public_nonparsing_methods,
+                                  "profile")
+
+    def profile(self) -> Dict[str, Any]:
+        """
+        Parses all rider's header fields from HTML at once. Rider's info is
+        walked only once and the result is memoized, so it's cheaper than
+        calling the parsing methods of the fields one by one.
+
+        :return: Dict with keys ``name``, ``nationality``, ``birthdate``,
+            ``place_of_birth``, ``weight``, ``height`` and ``image_url``.
+            Values are the same as returned by methods with the same names.
+        """
+        return dict(self._memoized("profile", self._parse_profile))
+
     def birthdate(self) -> str:
         """
         Parses rider's birthdate from HTML.
@@ -37,22 +52,8 @@ class Rider(Scraper):
         :return: birthday of the rider in ``YYYY-MM-DD`` format.
         """
         general_info_html = self.html.css_first(".rdr-info-cont")
-        bd_string = general_info_html.text(separator=" ", deep=False)
-        bd_list = [item for item in bd_string.split(" ") if item][:3]
-
-        # Make sure bd_list has 3 elements
-        if len(bd_list) != 3:
-            return None
-
-        [day, str_month, year] = bd_list
-        months = list(calendar.month_name)
-
-        # Make sure that the month is a valid month name
-        if str_month not in months:
-            return None
-
-        month = list(calendar.month_name).index(str_month)
-        return f"{year}-{month}-{day}"
+        return self._birthdate_from_text(
+            general_info_html.text(separator=" ", deep=False))
 
     def place_of_birth(self) -> Optional[str]:
         """
@@ -82,51 +83,13 @@ class Rider(Scraper):
         """
         return self.html.css_first(".page-title > .main > h1").text()
 
-    def _weight(self) -> Optional[float]:
-        """
-        Helper method for parsing weight.
-
-        :return: Rider's weigth in kilograms.
-        """
-        # normal layout
-        try:
-            weight_html = self.html.css(".rdr-info-cont > span")[1]
-            return float(weight_html.text().split(" ")[1])
-        # special layout
-        except (AttributeError, IndexError):
-            try:
-                weight_html = self.html.css(".rdr-info-cont > span > span")[1]
-                return float(weight_html.text().split(" ")[1])
-            except Exception:
-                return None
-
     def weight(self) -> Optional[float]:
         """
-        Parses rider's height from HTML.
-
-        :return: Rider's height in meters.
-        """
-        return get_height_weight(self._height(), self._weight())[1]
-
-    def _height(self) -> Optional[float]:
-        """
-        Helper method for parsing height.
+        Parses rider's weight from HTML.
 
-        :return: Rider's height in meters.
+        :return: Rider's weight in kilograms.
         """
-        # normal layout
-        try:
-            height_html = self.html.css_first(".rdr-info-cont > span > span")
-            return float(height_html.text().split(" ")[1])
-        # special layout
-        except (AttributeError, IndexError):
-            try:
-                height_html = self.html.css_first(
-                    ".rdr-info-cont > span > span > span")
-                return float(height_html.text().split(" ")[1])
-            # Height not found
-            except Exception:
-                return None
+        return self._memoized("profile", self._parse_profile)['weight']
 
     def height(self) -> Optional[float]:
         """
@@ -134,8 +97,8 @@ class Rider(Scraper):
 
         :return: Rider's height in meters.
         """
-        return get_height_weight(self._height(), self._weight())[0]
-            
+        return self._memoized("profile", self._parse_profile)['height']
+
     def nationality(self) -> str:
         """
         Parses rider's nationality from HTML.
@@ -165,7 +128,101 @@ class Rider(Scraper):
             return None
         return image_html.attributes['src']
 
-    def teams_history(self, *args: str) -> List[Dict[str, Any]]:
+    def _parse_profile(self) -> Dict[str, Any]:
+        """
+        Parses rider's header fields by walking `.rdr-info-cont` once. Values
+        are found by their labels (e.g. ``Weight:``), so the walk doesn't
+        depend on nesting of the elements.
+
+        :return: Dict with rider's header fields.
+        """
+        info_html = self.html.css_first(".rdr-info-cont")
+        label_texts: Dict[str, List[str]] = {}
+        nationality = None
+        place_of_birth = None
+        label = None
+        nodes = info_html.traverse(include_text=True) if info_html else iter(())
+        # skip .rdr-info-cont element itself
+        next(nodes, None)
+        for node in nodes:
+            tag = node.tag
+            if tag == "-text":
+                parent_tag = node.parent.tag if node.parent else None
+                # skip label texts and ordinal suffixes of dates
+                if label is not None and parent_tag not in ("b", "sup"):
+                    label_texts[label].append(node.text_content or "")
+            elif tag == "b":
+                label = node.text().strip().rstrip(":")
+                label_texts.setdefault(label, [])
+            elif tag == "br":
+                label = None
+            elif tag == "div":
+                # header fields are followed by points per speciality
+                break
+            elif tag == "span" and nationality is None:
+                classes = (node.attributes.get("class") or "").split()
+                if "flag" in classes:
+                    nationality = classes[-1].upper()
+            elif tag == "a" and label == "Place of birth" and \
+                    place_of_birth is None:
+                place_of_birth = node.text()
+
+        weight = self._first_number(label_texts.get("Weight"))
+        height = self._first_number(label_texts.get("Height"))
+        height, weight = get_height_weight(height, weight)
+        image_html = self.html.css_first("div.rdr-img-cont > a > img")
+        return {
+            "name": self.name(),
+            "nationality": nationality,
+            "birthdate": self._birthdate_from_text(
+                " ".join(label_texts.get("Date of birth", []))),
+            "place_of_birth": place_of_birth,
+            "weight": weight,
+            "height": height,
+            "image_url": image_html.attributes['src'] if image_html else None
+        }
+
+    @staticmethod
+    def _first_number(texts: Optional[List[str]]) -> Optional[float]:
+        """
+        Parses the first word of given texts as number.
+
+        :param texts: Texts of a header field, e.g. ``[" 61 kg "]``.
+        :return: Parsed number, None when there isn't any.
+        """
+        if not texts:
+            return None
+        try:
+            return float("".join(texts).split()[0])
+        except (IndexError, ValueError):
+            return None
+
+    @staticmethod
+    def _birthdate_from_text(text: str) -> Optional[str]:
+        """
+        Parses birthdate from text in ``6 December 1982 (42)`` format.
+
+        :param text: Text with birthdate.
+        :return: Birthdate in ``YYYY-MM-DD`` format, None when the text
+            isn't in the format.
+        """
+        bd_list = text.split()[:3]
+        # Make sure bd_list has 3 elements
+        if len(bd_list) != 3:
+            return None
+
+        [day, str_month, year] = bd_list
+        months = list(calendar.month_name)
+
+        # Make sure that the month is a valid month name
+        if str_month not in months:
+            return None
+
+        month = months.index(str_month)
+        return f"{year}-{month}-{day}"
+
+    def teams_history(self, *args: str, as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Parses rider's team history throughout career.
 
@@ -181,6 +238,9 @@ class Rider(Scraper):
             - until: Last day for rider in current season in the team in
               ``MM-DD`` format, most of the time ``12-31``.
 
+        :param as_columns: Whether to return the table as dict of lists
+            (field to values of all rows) instead of list of dicts, defaults
+            to False.
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
@@ -220,9 +280,10 @@ class Rider(Scraper):
         # if "class" not in fields:
         #     for row in table:
         #         row.pop("class")
-        return table_parser.table
+        return self._table_output(table_parser, as_columns)
 
-    def points_per_season_history(self, *args: str) -> List[Dict[str, Any]]:
+    def points_per_season_history(self, *args: str, as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Parses rider's points per season history.
 
@@ -233,6 +294,9 @@ class Rider(Scraper):
             - points: PCS points gained throughout the season.
             - rank: PCS ranking position after the season.
 
+        :param as_columns: Whether to return the table as dict of lists
+            (field to values of all rows) instead of list of dicts, defaults
+            to False.
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
@@ -244,10 +308,10 @@ class Rider(Scraper):
         fields = parse_table_fields_args(args, available_fields)
         points_table_html = self.html.css_first("table.rdr-season-stats")
         if points_table_html is None:
-            return []
+            return self._table_output([], as_columns, fields)
         table_parser = TableParser(points_table_html)
         table_parser.parse(fields)
-        return table_parser.table
+        return self._table_output(table_parser, as_columns)
 
     def points_per_speciality(self) -> Dict[str, int]:
         """
@@ -261,7 +325,8 @@ class Rider(Scraper):
         keys = ["one_day_races", "gc", "time_trial", "sprint", "climber", "hills"]
         return dict(zip(keys, pnts))
     
-    def season_results(self, *args: str) -> List[Dict[str, Any]]:
+    def season_results(self, *args: str, as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Parses rider's results from season specified in URL. If no URL is
         specified, results from current season are parsed.
@@ -281,6 +346,9 @@ class Rider(Scraper):
             - pcs_points:
             - uci_points:
 
+        :param as_columns: Whether to return the table as dict of lists
+            (field to values of all rows) instead of list of dicts, defaults
+            to False.
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
@@ -301,14 +369,13 @@ class Rider(Scraper):
                 casual_fields.remove(field)
 
         results_html = self.html.css_first("#resultsCont > table.rdrResults")
-        for tr in results_html.css("tbody > tr"):
-            if not tr.css("td")[1].text():
-                tr.remove()
 
         # Clean string when there's an additional crossed-out value. Takes most recent updated value
         clean_crossed_out_val = lambda x: x.strip().split(' ')[-1]
 
-        table_parser = TableParser(results_html)
+        # skip rows without result
+        table_parser = TableParser(results_html,
+            row_filter=lambda row: bool(row.css("td")[1].text()))
         if casual_fields:
             table_parser.parse(casual_fields)
         if "date" in fields:
@@ -345,4 +412,4 @@ class Rider(Scraper):
                 float(clean_crossed_out_val(x)) if x.isnumeric() else 0)
             table_parser.extend_table("uci_points", uci_points)
             
-        return table_parser.table
+        return self._table_output(table_parser, as_columns)
@@ -1,46 +1,82 @@
+import asyncio
 import inspect
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import (Any, Callable, Dict, List, Optional, Sequence, Tuple, Type,
+                    TypeVar, Union)
 
-import requests
 from selectolax.parser import HTMLParser
 
+from .cache import CacheEntry, HTMLCache, get_cache
 from .errors import ExpectedParsingError
+from .ratelimit import THROTTLED_PAGE_TEXT, get_rate_limiter
+from .session import (AsyncTransport, HTTPSession, SingleFlight,
+                      ThreadedTransport, get_session, get_transport)
+from .table_parser import TableParser
+from .utils import (canonical_url, columns_to_table, parse_html,
+                    sniff_encoding, table_to_columns)
+
+ScraperT = TypeVar("ScraperT", bound="Scraper")
+T = TypeVar("T")
 
 
 class Scraper:
     """Base class for all scraping classes."""
     BASE_URL: str = "https://www.procyclingstats.com/"
+    single_flight: Optional[SingleFlight] = SingleFlight()
+    """
+    Coalesces concurrent HTML updates of the same page, so objects created
+    from the same URL at once (e.g. by `fetch_many`) share one request and
+    one parsed HTML. None disables the coalescing.
+    """
 
     _public_nonparsing_methods = (
         "update_html",
         "parse",
-        "relative_url"
+        "relative_url",
+        "fetch_many",
+        "afetch",
+        "afetch_many",
+        "aupdate_html"
     )
     """Public methods that aren't called by `parse` method."""
+    # HTML and values memoized from it, replaced as one tuple so threads
+    # sharing the object never see values of other HTML
+    _memo: Optional[Tuple[HTMLParser, Dict[str, Any]]] = None
 
-    def __init__(self, url: str, html: Optional[str] = None,
-                 update_html: bool = True) -> None:
+    def __init__(self, url: str, html: Optional[Union[str, bytes]] = None,
+                 update_html: bool = True,
+                 session: Optional[HTTPSession] = None,
+                 cache: Optional[HTMLCache] = None) -> None:
         """
         Creates scraper object that is by default ready for HTML parsing. Call
         parsing methods to parse data from HTML.
 
         :param url: URL of procyclingstats page to parse. Either absolute or
             relative.
-        :param html: HTML to be parsed from, defaults to None. When passing the
-            parameter, set `update_html` to False to prevent overriding or
+        :param html: HTML to be parsed from, either as string or as raw bytes
+            (e.g. page stored by `HTMLCache`), defaults to None. When passing
+            the parameter, set `update_html` to False to prevent overriding or
             making useless request.
         :param update_html: Whether to make request to given URL and update
             `self.html`. When False `self.update_html` method has to be called
             manually to make object ready for parsing. Defaults to True.
+        :param session: Session to make requests with, defaults to None. When
+            None, session returned by `get_session` is used.
+        :param cache: Cache of raw HTMLs, defaults to None. When None, cache
+            returned by `get_cache` is used (caching is disabled by default).
 
         :raises ValueError: When given HTML or HTML from given URL is invalid,
             e.g. 'Page not found' is contained in the HTML.
         """
         # validate given URL
         self._url = self._make_url_absolute(url)
+        self._session = session
+        self._cache = cache
         self._html = None
+        self._html_body_id = None
         if html:
-            self._html = HTMLParser(html)
+            self._html = parse_html(html)
             if not self._html_valid():
                 raise ValueError("Given HTML is invalid.")
             self._set_up_html()
@@ -51,6 +87,97 @@ class Scraper:
                     f"HTML from given URL is invalid: '{self.url}'")
             self._set_up_html()
 
+    @classmethod
+    def fetch_many(cls: Type[ScraperT], urls: Sequence[str],
+                   max_workers: int = 8,
+                   **kwargs: Any) -> List[Union[ScraperT, Exception]]:
+        """
+        Creates scraper objects ready for HTML parsing from given URLs. HTMLs
+        are requested concurrently using a thread pool.
+
+        :param urls: URLs of procyclingstats pages to parse. Either absolute
+            or relative.
+        :param max_workers: Maximum count of requests made at once, defaults
+            to 8. Should not be larger than `pool_maxsize` of the used
+            session, otherwise connections aren't reused.
+        :param kwargs: Keyword arguments passed to the constructor, e.g.
+            `session`.
+        :return: List with scraper objects in the same order as given URLs.
+            When creating an object fails, the raised exception (e.g.
+            ``ValueError`` for invalid HTML) is in its place instead.
+        """
+        def create(url: str) -> Union[ScraperT, Exception]:
+            try:
+                return cls(url, **kwargs)
+            except Exception as e: # pylint: disable=broad-except
+                return e
+
+        if not urls:
+            return []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(create, urls))
+
+    @classmethod
+    async def afetch(cls: Type[ScraperT], url: str,
+                     transport: Optional[AsyncTransport] = None,
+                     **kwargs: Any) -> ScraperT:
+        """
+        Asynchronous variant of the constructor. Creates scraper object ready
+        for HTML parsing without blocking the event loop while waiting for
+        the response.
+
+        :param url: URL of procyclingstats page to parse. Either absolute or
+            relative.
+        :param transport: Asynchronous transport to make request with,
+            defaults to None. When None, transport returned by
+            `get_transport` is used.
+        :param kwargs: Keyword arguments passed to the constructor, e.g.
+            `session`.
+
+        :raises ValueError: When HTML from given URL is invalid.
+        :return: Scraper object ready for HTML parsing.
+        """
+        scraper_obj = cls(url, update_html=False, **kwargs)
+        await scraper_obj.aupdate_html(transport)
+        if not scraper_obj._html_valid():
+            raise ValueError(
+                f"HTML from given URL is invalid: '{scraper_obj.url}'")
+        scraper_obj._set_up_html()
+        return scraper_obj
+
+    @classmethod
+    async def afetch_many(cls: Type[ScraperT], urls: Sequence[str],
+                          concurrency: int = 8,
+                          transport: Optional[AsyncTransport] = None,
+                          **kwargs: Any) -> List[Union[ScraperT, Exception]]:
+        """
+        Asynchronous variant of `fetch_many`. Creates scraper objects ready
+        for HTML parsing from given URLs.
+
+        :param urls: URLs of procyclingstats pages to parse. Either absolute
+            or relative.
+        :param concurrency: Maximum count of requests made at once, defaults
+            to 8.
+        :param transport: Asynchronous transport to make requests with,
+            defaults to None. When None, transport returned by
+            `get_transport` is used.
+        :param kwargs: Keyword arguments passed to the constructor, e.g.
+            `session`.
+        :return: List with scraper objects in the same order as given URLs.
+            When creating an object fails, the raised exception is in its
+            place instead.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def create(url: str) -> Union[ScraperT, Exception]:
+            async with semaphore:
+                try:
+                    return await cls.afetch(url, transport, **kwargs)
+                except Exception as e: # pylint: disable=broad-except
+                    return e
+
+        return list(await asyncio.gather(*[create(url) for url in urls]))
+
     def __repr__(self) -> str:
         return f"{type(self).__name__}(url='{self.url}')"
 
@@ -59,6 +186,26 @@ class Scraper:
         """Absolute URL from URL that was passed when constructing."""
         return self._url
 
+    @property
+    def session(self) -> HTTPSession:
+        """
+        Session used for making requests. Either the one given when
+        constructing, or the default one.
+        """
+        if self._session is None:
+            return get_session()
+        return self._session
+
+    @property
+    def cache(self) -> Optional[HTMLCache]:
+        """
+        Cache of raw HTMLs used when updating HTML. Either the one given when
+        constructing, or the default one. None when caching is disabled.
+        """
+        if self._cache is None:
+            return get_cache()
+        return self._cache
+
     @property
     def html(self) -> HTMLParser:
         """
@@ -82,12 +229,40 @@ class Scraper:
 
     def update_html(self) -> None:
         """
-        Calls request to `self.url` and updates `self.html` to HTMLParser
-        object created from returned HTML.
+        Calls request to `self.url` using `self.session` and updates
+        `self.html` to HTMLParser object created from returned HTML. When
+        `self.cache` contains fresh HTML of the page, request isn't made.
+        Expired cached HTML is revalidated with conditional request. When
+        HTML of the same page is being updated by another object at the same
+        time, its result is shared (see `single_flight`).
+        """
+        if self.single_flight is None:
+            self._load_html()
+            return
+        self._html, self._html_body_id = self.single_flight.do(
+            canonical_url(self._url), self._load_html)
+
+    async def aupdate_html(self,
+                           transport: Optional[AsyncTransport] = None) -> None:
         """
-        html_str = requests.get(self._url).text \
-            # pylint: disable=missing-timeout
-        self._html = HTMLParser(html_str)
+        Asynchronous variant of `update_html`. Makes request to `self.url`
+        and updates `self.html` to HTMLParser object created from returned
+        HTML.
+
+        :param transport: Asynchronous transport to make request with,
+            defaults to None. When None and the object has its own session,
+            requests are made with the session in an executor, otherwise
+            transport returned by `get_transport` is used.
+        """
+        if transport is None and self._session is not None:
+            transport = ThreadedTransport(self._session)
+        elif transport is None:
+            transport = get_transport()
+        if self.single_flight is None:
+            await self._aload_html(transport)
+            return
+        self._html, self._html_body_id = await self.single_flight.ado(
+            canonical_url(self._url), lambda: self._aload_html(transport))
 
     def parse(self,
             exceptions_to_ignore: Tuple[
@@ -115,6 +290,218 @@ class Scraper:
                     parsed_data[method_name] = None
         return parsed_data
 
+    def _load_html(self) -> Tuple[HTMLParser, Optional[str]]:
+        """
+        Updates `self.html` either from `self.cache` or by making request.
+
+        :return: Tuple of updated HTML and identifier of its cached body.
+        """
+        entry = self._update_html_from_cache()
+        if entry is None or not entry.fresh:
+            response = self._request(self._conditional_headers(entry))
+            self._update_html_from_response(response, entry)
+        return self.html, self._html_body_id
+
+    async def _aload_html(self, transport: AsyncTransport
+                          ) -> Tuple[HTMLParser, Optional[str]]:
+        """
+        Asynchronous variant of `_load_html`.
+
+        :param transport: Transport to make request with.
+        :return: Tuple of updated HTML and identifier of its cached body.
+        """
+        entry = self._update_html_from_cache()
+        if entry is None or not entry.fresh:
+            response = await self._arequest(transport,
+                                            self._conditional_headers(entry))
+            self._update_html_from_response(response, entry)
+        return self.html, self._html_body_id
+
+    def _request(self, headers: Dict[str, str]) -> Any:
+        """
+        Makes request to `self.url` using `self.session`. When rate limiter
+        is set, the request waits for it and throttled requests are retried.
+
+        :param headers: Headers of the request.
+        :return: Response object.
+        """
+        rate_limiter = get_rate_limiter()
+        if rate_limiter is None:
+            return self.session.get(self._url, headers=headers)
+        attempt = 0
+        while True:
+            rate_limiter.acquire()
+            throttled, received = False, False
+            try:
+                response = self.session.get(self._url, headers=headers)
+                throttled = rate_limiter.is_throttled(response)
+                received = True
+            finally:
+                # limits aren't adapted when the request failed
+                rate_limiter.release(throttled, adapt=received)
+            if not throttled or attempt >= rate_limiter.max_retries:
+                return response
+            time.sleep(rate_limiter.backoff(attempt, response))
+            attempt += 1
+
+    async def _arequest(self, transport: AsyncTransport,
+                        headers: Dict[str, str]) -> Any:
+        """
+        Asynchronous variant of `_request`.
+
+        :param transport: Transport to make request with.
+        :param headers: Headers of the request.
+        :return: Response object.
+        """
+        rate_limiter = get_rate_limiter()
+        if rate_limiter is None:
+            return await transport.get(self._url, headers=headers)
+        attempt = 0
+        while True:
+            await rate_limiter.aacquire()
+            throttled, received = False, False
+            try:
+                response = await transport.get(self._url, headers=headers)
+                throttled = rate_limiter.is_throttled(response)
+                received = True
+            finally:
+                # limits aren't adapted when the request failed
+                rate_limiter.release(throttled, adapt=received)
+            if not throttled or attempt >= rate_limiter.max_retries:
+                return response
+            await asyncio.sleep(rate_limiter.backoff(attempt, response))
+            attempt += 1
+
+    def _update_html_from_cache(self) -> Optional[CacheEntry]:
+        """
+        Looks up the page in `self.cache` and updates `self.html` from it when
+        the cached page is fresh.
+
+        :return: Cached entry of the page (either fresh or expired), None when
+            the page isn't cached or caching is disabled.
+        """
+        cache = self.cache
+        if cache is None:
+            return None
+        entry = cache.get(self._url)
+        if entry is not None and entry.fresh:
+            self._update_html_from_entry(entry)
+        return entry
+
+    def _update_html_from_entry(self, entry: CacheEntry) -> None:
+        """
+        Updates `self.html` from cached entry. When current HTML was created
+        from the same body, it's kept so the page isn't parsed again.
+
+        :param entry: Cached entry of the page.
+        """
+        body_id = entry.body_id
+        if self._html is not None and self._html_body_id == body_id:
+            return
+        self._html = parse_html(entry.body, entry.encoding)
+        self._html_body_id = body_id
+
+    def _update_html_from_response(self, response: Any,
+                                   entry: Optional[CacheEntry]) -> None:
+        """
+        Updates `self.html` from given response and stores the HTML to
+        `self.cache` if the response is valid. When the response tells that
+        expired cached entry hasn't changed, HTML is updated from the entry.
+
+        :param response: Response to request made to `self.url`.
+        :param entry: Expired cached entry of the page that was revalidated
+            by the request, None when the page wasn't cached.
+        """
+        cache = self.cache
+        if cache is not None and entry is not None and \
+                response.status_code == 304:
+            self._update_html_from_entry(cache.revalidate(entry))
+            return
+        body, encoding = self._response_body(response)
+        self._html = parse_html(body, encoding)
+        self._html_body_id = None
+        if (cache is not None and response.status_code == 200 and
+                self._html_valid()):
+            stored_entry = cache.store(
+                self._url, body, encoding,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                replaces=entry)
+            self._html_body_id = stored_entry.body_id
+
+    @staticmethod
+    def _response_body(response: Any) -> Tuple[bytes, str]:
+        """
+        Gets raw body of the response and its encoding. The body isn't
+        decoded, so slow charset detection of `requests` is skipped.
+
+        :param response: Response object.
+        :return: Tuple of the body and name of its encoding.
+        """
+        content = getattr(response, "content", None)
+        if content is None:
+            # transports that don't provide raw body
+            return response.text.encode("utf-8"), "utf-8"
+        return content, sniff_encoding(content,
+                                       response.headers.get("Content-Type"))
+
+    @staticmethod
+    def _conditional_headers(entry: Optional[CacheEntry]) -> Dict[str, str]:
+        """
+        Makes headers for request revalidating expired cached entry.
+
+        :param entry: Expired cached entry, None when the page isn't cached.
+        :return: Conditional request headers, empty when there is nothing to
+            revalidate.
+        """
+        if entry is None:
+            return {}
+        return entry.conditional_headers()
+
+    def _memoized(self, key: str, func: Callable[[], T]) -> T:
+        """
+        Gets value computed from current HTML, `func` is called only when the
+        value wasn't computed yet. Values are dropped whenever HTML is
+        updated, so every DOM scan is done once per HTML load.
+
+        :param key: Name of the value.
+        :param func: Function computing the value.
+        :return: Memoized value.
+        """
+        memo = self._memo
+        if memo is None or memo[0] is not self.html:
+            memo = (self.html, {})
+            self._memo = memo
+        values = memo[1]
+        if key not in values:
+            values[key] = func()
+        return values[key]
+
+    @staticmethod
+    def _table_output(table: Union[TableParser, List[Dict[str, Any]],
+                                   Dict[str, List[Any]]],
+                      as_columns: bool,
+                      fields: Optional[List[str]] = None
+                      ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
+        """
+        Converts parsed table to the output format of table parsing methods.
+
+        :param table: Table parser after parsing or already parsed table,
+            either as list of dicts or as dict of lists.
+        :param as_columns: Whether to return the table as dict of lists
+            instead of list of dicts.
+        :param fields: Fields of the table, needed to return columns of
+            table without rows, defaults to None.
+        :return: Table in wanted format.
+        """
+        if isinstance(table, TableParser):
+            return table.columns if as_columns else table.table
+        if isinstance(table, dict):
+            return table if as_columns else columns_to_table(table)
+        if as_columns and not table and fields is not None:
+            return {field: [] for field in fields}
+        return table_to_columns(table) if as_columns else table
+
     def _decompose_url(self) -> List[str]:
         """
         Splits relative URL to list of strings.
@@ -177,8 +564,7 @@ class Scraper:
             assert page_title != "Page not found"
 
             page_title2 = self.html.css_first("div.page-content > div").text()
-            assert page_title2 != ("Due to technical difficulties this page " +
-            "is temporarily unavailable.")
+            assert page_title2 != THROTTLED_PAGE_TEXT
 
             page_title3 = self.html.css_first(
                 ".page-title > .main > h1").text()
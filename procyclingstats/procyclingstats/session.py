@@ -0,0 +1,341 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import Executor
+from typing import (TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional,
+                    Tuple, Union)
+
+if TYPE_CHECKING:
+    import requests
+
+    from .adapter import CountingAdapter
+
+
+class HTTPSession:
+    """
+    Thread-safe HTTP session with keep-alive connection pooling. One session
+    is shared by all scraper objects by default (see `get_session`), so TCP
+    and TLS connections to procyclingstats are reused across requests.
+
+    :param pool_connections: Number of connection pools (one per host) to
+        cache, defaults to 10.
+    :param pool_maxsize: Maximum number of connections kept alive per pool,
+        should be at least the number of threads making requests concurrently.
+        Defaults to 10.
+    :param timeout: Default timeout in seconds for every request, either
+        single number or ``(connect, read)`` tuple. Defaults to ``(10, 30)``.
+    :param headers: Headers sent with every request, merged into the default
+        `requests` headers, defaults to None.
+    :param max_retries: Number of retries on connection errors, defaults to 0.
+
+    Underlying `requests` session is created when it's used for the first
+    time, so creating (or configuring) the session doesn't import `requests`.
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10,
+                 timeout: Union[float, Tuple[float, float]] = (10, 30),
+                 headers: Optional[Dict[str, str]] = None,
+                 max_retries: int = 0) -> None:
+        self.timeout = timeout
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self._headers = headers
+        self._session: Optional["requests.Session"] = None
+        self._adapter: Optional["CountingAdapter"] = None
+        self._lock = threading.Lock()
+        self._requests_count = 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(timeout={self.timeout})"
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Headers that are sent with every request."""
+        return self._requests_session().headers # type: ignore
+
+    def get(self, url: str, **kwargs: Any) -> "requests.Response":
+        """
+        Makes GET request to given URL using pooled connections.
+
+        :param url: Absolute URL to make request to.
+        :param kwargs: Keyword arguments passed to `requests.Session.get`,
+            `timeout` defaults to `self.timeout`.
+        :return: Response object.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        with self._lock:
+            self._requests_count += 1
+        return self._requests_session().get(url, **kwargs)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Gets connection reuse counters of the session.
+
+        :return: Dict with keys ``requests`` (requests made through the
+            session), ``connections`` (TCP connections opened) and ``reused``
+            (requests that were sent over already opened connection).
+        """
+        connections, pool_requests = 0, 0
+        if self._adapter is not None:
+            connections, pool_requests = self._adapter.pool_counts()
+        with self._lock:
+            requests_count = self._requests_count
+        return {
+            "requests": requests_count,
+            "connections": connections,
+            "reused": max(pool_requests - connections, 0)
+        }
+
+    def close(self) -> None:
+        """Closes all pooled connections of the session."""
+        if self._session is not None:
+            self._session.close()
+
+    def _requests_session(self) -> "requests.Session":
+        """
+        Gets `requests` session making the requests, creates it on the first
+        call.
+
+        :return: Session with mounted connection pooling adapter.
+        """
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    # pylint: disable=import-outside-toplevel
+                    import requests
+
+                    from .adapter import CountingAdapter
+                    session = requests.Session()
+                    if self._headers:
+                        session.headers.update(self._headers)
+                    self._adapter = CountingAdapter(
+                        pool_connections=self.pool_connections,
+                        pool_maxsize=self.pool_maxsize,
+                        max_retries=self.max_retries)
+                    session.mount("https://", self._adapter)
+                    session.mount("http://", self._adapter)
+                    self._session = session
+        return self._session
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key, so only the first caller
+    (the leader) executes the call and the others wait for its result. Calls
+    are coalesced only while in flight, results aren't stored afterwards.
+    Synchronous calls from threads and asynchronous calls from tasks of the
+    same event loop are coalesced separately.
+    """
+
+    class _Call:
+        def __init__(self) -> None:
+            self.done = threading.Event()
+            self.result: Any = None
+            self.error: Optional[BaseException] = None
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[str, "SingleFlight._Call"] = {}
+        self._futures: Dict[Tuple[int, str], asyncio.Future] = {}
+        self._stats = {
+            "calls": 0,
+            "shared": 0
+        }
+
+    def do(self, key: str, func: Callable[[], Any]) -> Any:
+        """
+        Calls given function unless call with the same key is already in
+        flight, in that case waits for the result of that call.
+
+        :param key: Key identifying the call, e.g. canonical URL.
+        :param func: Function to call.
+        :return: Result of the function (same object for all coalesced
+            callers).
+        """
+        with self._lock:
+            self._stats['calls'] += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = self._Call()
+            else:
+                self._stats['shared'] += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def ado(self, key: str,
+                  func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Asynchronous variant of `do`.
+
+        :param key: Key identifying the call, e.g. canonical URL.
+        :param func: Function returning awaitable to await.
+        :return: Result of the awaitable (same object for all coalesced
+            callers).
+        """
+        loop = asyncio.get_running_loop()
+        future_key = (id(loop), key)
+        with self._lock:
+            self._stats['calls'] += 1
+            future = self._futures.get(future_key)
+            if future is not None:
+                self._stats['shared'] += 1
+        if future is not None:
+            return await asyncio.shield(future)
+        future = loop.create_future()
+        with self._lock:
+            self._futures[future_key] = future
+        try:
+            result = await func()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            # exception is retrieved by the leader, so it isn't logged when
+            # no one else is waiting for the future
+            future.exception()
+            raise
+        finally:
+            with self._lock:
+                del self._futures[future_key]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Gets counters of the calls.
+
+        :return: Dict with keys ``calls`` (all calls) and ``shared`` (calls
+            that waited for result of another call).
+        """
+        with self._lock:
+            return dict(self._stats)
+
+
+_default_session: Optional[HTTPSession] = None
+_default_session_lock = threading.Lock()
+
+
+def get_session() -> HTTPSession:
+    """
+    Gets session used by scraper objects that weren't given their own session.
+    The session is created on first call.
+
+    :return: Default session.
+    """
+    global _default_session # pylint: disable=global-statement
+    if _default_session is None:
+        with _default_session_lock:
+            if _default_session is None:
+                _default_session = HTTPSession()
+    return _default_session
+
+
+def set_session(session: HTTPSession) -> None:
+    """
+    Sets session used by scraper objects that weren't given their own session.
+
+    :param session: Session to use by default.
+    """
+    global _default_session # pylint: disable=global-statement
+    with _default_session_lock:
+        _default_session = session
+
+
+def configure_session(**kwargs: Any) -> HTTPSession:
+    """
+    Creates new default session with given configuration.
+
+    :param kwargs: Keyword arguments passed to `HTTPSession` constructor.
+    :return: Newly created default session.
+    """
+    session = HTTPSession(**kwargs)
+    set_session(session)
+    return session
+
+
+class AsyncTransport:
+    """
+    Base class for asynchronous transports used by `Scraper.afetch` and
+    `Scraper.afetch_many`. Subclasses have to override `get` method, e.g.
+    to make requests with an asynchronous HTTP client or to return responses
+    from a local server in tests.
+    """
+
+    async def get(self, url: str, **kwargs: Any) -> Any:
+        """
+        Makes GET request to given URL.
+
+        :param url: Absolute URL to make request to.
+        :param kwargs: Keyword arguments of the request, e.g. `headers`.
+        :return: Response object with attributes of `requests.Response`
+            object that are needed by scrapers, currently `status_code`,
+            `headers` and `content` (raw body). Transports that can't provide
+            raw body may provide decoded `text` instead.
+        """
+        raise NotImplementedError
+
+    async def aclose(self) -> None:
+        """Releases resources of the transport, does nothing by default."""
+
+
+class ThreadedTransport(AsyncTransport):
+    """
+    Asynchronous transport which makes requests with `HTTPSession` in an
+    executor, so event loop isn't blocked while waiting for the response.
+
+    :param session: Session to make requests with, defaults to None. When
+        None, session returned by `get_session` is used.
+    :param executor: Executor to run requests in, defaults to None (default
+        executor of the running event loop).
+    """
+
+    def __init__(self, session: Optional[HTTPSession] = None,
+                 executor: Optional[Executor] = None) -> None:
+        self.session = session
+        self.executor = executor
+
+    async def get(self, url: str, **kwargs: Any) -> Any:
+        session = self.session if self.session is not None else get_session()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(session.get, url, **kwargs))
+
+
+_default_transport: Optional[AsyncTransport] = None
+
+
+def get_transport() -> AsyncTransport:
+    """
+    Gets asynchronous transport used by `Scraper.afetch` when no transport is
+    given. By default it's `ThreadedTransport` using the default session.
+
+    :return: Default asynchronous transport.
+    """
+    global _default_transport # pylint: disable=global-statement
+    if _default_transport is None:
+        _default_transport = ThreadedTransport()
+    return _default_transport
+
+
+def set_transport(transport: AsyncTransport) -> None:
+    """
+    Sets asynchronous transport used by `Scraper.afetch` when no transport is
+    given.
+
+    :param transport: Transport to use by default.
+    """
+    global _default_transport # pylint: disable=global-statement
+    _default_transport = transport
@@ -1,12 +1,12 @@
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 
-from selectolax.parser import HTMLParser, Node
+from selectolax.parser import Node
 
 from .errors import ExpectedParsingError
 from .scraper import Scraper
 from .table_parser import TableParser
-from .utils import (add_times, convert_date, format_time, join_tables,
-                    parse_table_fields_args)
+from .utils import (convert_date, format_time, join_tables,
+                    parse_table_fields_args, seconds_to_time, time_to_seconds)
 
 
 class Stage(Scraper):
@@ -47,27 +47,6 @@ class Stage(Scraper):
     """
     _tables_path = ".result-cont table"
 
-    def _set_up_html(self) -> None:
-        """
-        Overrides Scraper method. Modifies HTML if stage is TTT by adding team
-        ranks to riders.
-        """
-        # add team ranks to every rider's first td element, so it's possible
-        # to map teams to riders based on their rank
-        categories = self.html.css(self._tables_path)
-        if not categories:
-            return
-        results_table_html = categories[0]
-        if self.stage_type() != "TTT":
-            return
-        current_rank_node = None
-        for column in results_table_html.css("tr > td:first-child"):
-            rank = column.text()
-            if rank:
-                current_rank_node = column
-            elif current_rank_node:
-                column.replace_with(current_rank_node) # type: ignore
-
     def is_one_day_race(self) -> bool:
         """
         Parses whether race is an one day race from HTML.
@@ -76,7 +55,8 @@ class Stage(Scraper):
         """
         # If there are elements with .restabs class (Stage/GC... menu), the race
         # is a stage race
-        return len(self.html.css(".restabs")) == 0
+        return self._memoized("is_one_day_race",
+            lambda: self.html.css_first(".restabs") is None)
 
     def distance(self) -> float:
         """
@@ -101,6 +81,14 @@ class Stage(Scraper):
         """
         Parses stage type from HTML.
 
+        :return: Stage type, e.g. ``ITT``.
+        """
+        return self._memoized("stage_type", self._parse_stage_type)
+
+    def _parse_stage_type(self) -> Literal["ITT", "TTT", "RR"]:
+        """
+        Parses stage type from HTML, `stage_type` memoizes it.
+
         :return: Stage type, e.g. ``ITT``.
         """
         stage_name_html = self.html.css_first(".sub > .blue")
@@ -251,7 +239,8 @@ class Stage(Scraper):
         """
         return self._stage_info_by_label("Race category")
       
-    def climbs(self, *args: str) -> List[Dict[str, str]]:
+    def climbs(self, *args: str, as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Parses listed climbs from the stage. When climbs aren't listed returns
         empty list.
@@ -262,6 +251,9 @@ class Stage(Scraper):
             - climb_name:
             - climb_url: URL of the location of the climb, NOT the climb itself
 
+        :param as_columns: Whether to return the table as dict of lists
+            (field to values of all rows) instead of list of dicts, defaults
+            to False.
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
@@ -272,13 +264,14 @@ class Stage(Scraper):
         fields = parse_table_fields_args(args, available_fields)
         climbs_html = self.html.css_first("ul.list.circle")
         if climbs_html is None:
-            return []
+            return self._table_output([], as_columns, fields)
 
         table_parser = TableParser(climbs_html)
         table_parser.parse(fields)
-        return table_parser.table
+        return self._table_output(table_parser, as_columns)
 
-    def results(self, *args: str) -> List[Dict[str, Any]]:
+    def results(self, *args: str, as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Parses main results table from HTML. If results table is TTT one day
         race, fields `age` and `nationality` are set to None if are requested,
@@ -297,10 +290,15 @@ class Stage(Scraper):
             - age: Rider's age.
             - nationality: Rider's nationality as 2 chars long country code.
             - time: Rider's time in the stage.
+            - time_seconds: Time as integer count of seconds, parsed
+              only when requested.
             - bonus: Bonus seconds in `H:MM:SS` time format.
             - pcs_points:
             - uci_points:
 
+        :param as_columns: Whether to return the table as dict of lists
+            (field to values of all rows) instead of list of dicts, defaults
+            to False.
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
@@ -319,11 +317,9 @@ class Stage(Scraper):
             "pcs_points",
             "uci_points"
         )
-        fields = parse_table_fields_args(args, available_fields)
-        # remove other result tables from html
-        # because of one day races self._table_index isn't used here
-        categories = self.html.css(self._tables_path)
-        results_table_html = categories[0]
+        fields = parse_table_fields_args(args, available_fields,
+                                         ("time_seconds",))
+        results_table_html = self._results_table_html()
         # Results table is empty
         if (not results_table_html or
             not results_table_html.css_first("tbody > tr")):
@@ -362,17 +358,14 @@ class Stage(Scraper):
                 for row in table:
                     row.pop("rider_url")
         else:
-            # remove rows that aren't results
-            for row in results_table_html.css("tbody > tr"):
-                columns = row.css("td")
-                if len(columns) <= 2 and columns[0].text() == "":
-                    row.remove()
-            table_parser = TableParser(results_table_html)
+            table_parser = TableParser(results_table_html,
+                                       row_filter=self._is_result_row)
             table_parser.parse(fields)
-            table = table_parser.table
-        return table
+            return self._table_output(table_parser, as_columns)
+        return self._table_output(table, as_columns, fields)
 
-    def gc(self, *args: str) -> List[Dict[str, Any]]: \
+    def gc(self, *args: str, as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]: \
         # pylint: disable=invalid-name
         """
         Parses GC results table from HTML. When GC is unavailable, empty list
@@ -391,10 +384,15 @@ class Stage(Scraper):
             - age: Rider's age.
             - nationality: Rider's nationality as 2 chars long country code.
             - time: Rider's GC time after the stage.
+            - time_seconds: Time as integer count of seconds, parsed
+              only when requested.
             - bonus: Bonus seconds that the rider gained throughout the race.
             - pcs_points:
             - uci_points:
 
+        :param as_columns: Whether to return the table as dict of lists
+            (field to values of all rows) instead of list of dicts, defaults
+            to False.
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
@@ -413,16 +411,18 @@ class Stage(Scraper):
             "pcs_points",
             "uci_points"
         )
-        fields = parse_table_fields_args(args, available_fields)
+        fields = parse_table_fields_args(args, available_fields,
+                                         ("time_seconds",))
         # remove other result tables from html
         gc_table_html = self._table_html("gc")
         if not gc_table_html:
-            return []
+            return self._table_output([], as_columns, fields)
         table_parser = TableParser(gc_table_html)
         table_parser.parse(fields)
-        return table_parser.table
+        return self._table_output(table_parser, as_columns)
 
-    def points(self, *args: str) -> List[Dict[str, Any]]:
+    def points(self, *args: str, as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Parses points classification results table from HTML. When points
         classif. is unavailable empty list is returned.
@@ -443,6 +443,9 @@ class Stage(Scraper):
             - pcs_points:
             - uci_points:
 
+        :param as_columns: Whether to return the table as dict of lists
+            (field to values of all rows) instead of list of dicts, defaults
+            to False.
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
@@ -464,12 +467,13 @@ class Stage(Scraper):
         # remove other result tables from html
         points_table_html = self._table_html("points")
         if not points_table_html:
-            return []
+            return self._table_output([], as_columns, fields)
         table_parser = TableParser(points_table_html)
         table_parser.parse(fields)
-        return table_parser.table
+        return self._table_output(table_parser, as_columns)
 
-    def kom(self, *args: str) -> List[Dict[str, Any]]:
+    def kom(self, *args: str, as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Parses KOM classification results table from HTML. When KOM classif. is
         unavailable empty list is returned.
@@ -490,6 +494,9 @@ class Stage(Scraper):
             - pcs_points:
             - uci_points:
 
+        :param as_columns: Whether to return the table as dict of lists
+            (field to values of all rows) instead of list of dicts, defaults
+            to False.
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
@@ -511,12 +518,13 @@ class Stage(Scraper):
         # remove other result tables from html
         kom_table_html = self._table_html("kom")
         if not kom_table_html:
-            return []
+            return self._table_output([], as_columns, fields)
         table_parser = TableParser(kom_table_html)
         table_parser.parse(fields)
-        return table_parser.table
+        return self._table_output(table_parser, as_columns)
 
-    def youth(self, *args: str) -> List[Dict[str, Any]]:
+    def youth(self, *args: str, as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Parses youth classification results table from HTML. When youth classif
         is unavailable empty list is returned.
@@ -532,11 +540,16 @@ class Stage(Scraper):
             - rank: Rider's youth classif. rank after the stage.
             - prev_rank: Rider's youth classif. rank before the stage.
             - time: Rider's GC time after the stage.
+            - time_seconds: Time as integer count of seconds, parsed
+              only when requested.
             - age: Rider's age.
             - nationality: Rider's nationality as 2 chars long country code.
             - pcs_points:
             - uci_points:
 
+        :param as_columns: Whether to return the table as dict of lists
+            (field to values of all rows) instead of list of dicts, defaults
+            to False.
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
@@ -554,15 +567,17 @@ class Stage(Scraper):
             "pcs_points",
             "uci_points"
         )
-        fields = parse_table_fields_args(args, available_fields)
+        fields = parse_table_fields_args(args, available_fields,
+                                         ("time_seconds",))
         youth_table_html = self._table_html("youth")
         if not youth_table_html:
-            return []
+            return self._table_output([], as_columns, fields)
         table_parser = TableParser(youth_table_html)
         table_parser.parse(fields)
-        return table_parser.table
+        return self._table_output(table_parser, as_columns)
 
-    def teams(self, *args: str) -> List[Dict[str, Any]]:
+    def teams(self, *args: str, as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Parses teams classification results table from HTML. When teams
         classif. is unavailable empty list is returned.
@@ -575,8 +590,13 @@ class Stage(Scraper):
             - rank: Teams's classif. rank after the stage.
             - prev_rank: Team's classif. rank before the stage.
             - time: Team's total GC time after the stage.
+            - time_seconds: Time as integer count of seconds, parsed
+              only when requested.
             - nationality: Team's nationality as 2 chars long country code.
 
+        :param as_columns: Whether to return the table as dict of lists
+            (field to values of all rows) instead of list of dicts, defaults
+            to False.
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
@@ -588,13 +608,53 @@ class Stage(Scraper):
             "time",
             "nationality"
         )
-        fields = parse_table_fields_args(args, available_fields)
+        fields = parse_table_fields_args(args, available_fields,
+                                         ("time_seconds",))
         teams_table_html = self._table_html("teams")
         if not teams_table_html:
-            return []
+            return self._table_output([], as_columns, fields)
         table_parser = TableParser(teams_table_html)
         table_parser.parse(fields)
-        return table_parser.table
+        return self._table_output(table_parser, as_columns)
+
+    @staticmethod
+    def _is_result_row(row: Node) -> bool:
+        """
+        Checks whether given results table row is a result, rows with at most
+        two columns where the first one is empty aren't results.
+
+        :param row: Table row HTML.
+        :return: Whether the row is a result.
+        """
+        columns = row.css("td")
+        return len(columns) > 2 or columns[0].text() != ""
+
+    def _results_table_html(self) -> Optional[Node]:
+        """
+        Gets HTML of the first .result-cont table, which is the stage results
+        table (one day races don't have .restabs menu).
+
+        :return: Results table HTML, None when not found.
+        """
+        return self._memoized("results_table",
+            lambda: self.html.css_first(self._tables_path))
+
+    def _infolist(self) -> Dict[str, str]:
+        """
+        Parses infolist to dict of labels and their values.
+
+        :return: Dict mapping infolist labels (as they are in the HTML, e.g.
+            ``Date:``) to their values. Value is empty string when the label
+            doesn't have one.
+        """
+        infolist = {}
+        for row in self.html.css("ul.infolist > li"):
+            row_text = row.text(separator="\n").split("\n")
+            row_text = [x for x in row_text if x != " "]
+            if row_text:
+                infolist.setdefault(row_text[0],
+                                    row_text[1] if len(row_text) > 1 else "")
+        return infolist
 
     def _stage_info_by_label(self, label: str) -> str:
         """
@@ -604,14 +664,10 @@ class Stage(Scraper):
         :return: Value of given label. Empty string when label is not in
             infolist.
         """
-        for row in self.html.css("ul.infolist > li"):
-            row_text = row.text(separator="\n").split("\n")
-            row_text = [x for x in row_text if x != " "]
-            if label in row_text[0]:
-                if len(row_text) > 1:
-                    return row_text[1]
-                else:
-                    return ""
+        for row_label, value in self._memoized("infolist",
+                                               self._infolist).items():
+            if label in row_label:
+                return value
         return ""
 
     def _table_html(self, table: Literal[
@@ -627,12 +683,23 @@ class Stage(Scraper):
         :param table: Keyword of wanted table that occures in .restabs menu.
         :return: HTML of wanted HTML table, None when not found.
         """
-        categories = self.html.css(".result-cont")
-        for i, element in enumerate(self.html.css("ul.restabs > li > a")):
-            if table in element.text().lower():
-                return categories[i].css_first("table")
+        for tab_name, table_html in self._memoized("restabs", self._restabs):
+            if table in tab_name:
+                return table_html
         return None
 
+    def _restabs(self) -> List[Tuple[str, Optional[Node]]]:
+        """
+        Maps .restabs menu items to .result-cont tables.
+
+        :return: List of tuples with lowercased name of the menu item and
+            HTML of its table (None when the item doesn't have a table).
+        """
+        categories = self.html.css(".result-cont")
+        tabs = self.html.css("ul.restabs > li > a")
+        return [(tab.text().lower(), category.css_first("table"))
+                for tab, category in zip(tabs, categories)]
+
     @staticmethod
     def _ttt_results(results_table_html: Node,
                      fields: List[str]) -> List[Dict[str, Any]]:
@@ -651,7 +718,6 @@ class Stage(Scraper):
             "team_url",
         ]
         rider_fields = [
-            "rank",
             "rider_name",
             "rider_url",
             "pcs_points",
@@ -661,51 +727,56 @@ class Stage(Scraper):
         team_fields_to_parse = [f for f in team_fields if f in fields]
         rider_fields_to_parse = [f for f in rider_fields if f in fields]
 
-        # add rank field to fields for joining tables purposes
+        # riders get rank of their team, it's needed for sorting
         if "rank" not in fields:
-            rider_fields_to_parse.append("rank")
             team_fields_to_parse.append("rank")
         # add rider_url for joining table with nationality or age from other
         # table, if isn't nedded is removed from table in self.results method
         if "rider_url" not in fields:
             rider_fields_to_parse.append("rider_url")
 
-        # create two copies of HTML table (one for riders and one for teams),
-        # so we won't modify self.html
-        riders_elements = HTMLParser(results_table_html.html) # type: ignore
-        riders_table = riders_elements.css_first("table")
-        teams_elements = HTMLParser(results_table_html.html) # type: ignore
-        teams_table = teams_elements.css_first("table")
-        # remove unwanted rows from both tables
-        riders_table.unwrap_tags(["tr.team"])
-        teams_table.unwrap_tags(["tr:not(.team)"])
-        teams_parser = TableParser(teams_table)
+        # split team rows and rider rows in one walk, every rider belongs to
+        # the closest team row above it
+        team_rows = []
+        rider_rows = []
+        riders_teams = []
+        for row in results_table_html.css("tbody > tr"):
+            if "team" in (row.attributes.get("class") or "").split():
+                team_rows.append(row)
+            elif team_rows:
+                rider_rows.append(row)
+                riders_teams.append(len(team_rows) - 1)
+        teams_parser = TableParser(results_table_html, rows=team_rows)
         teams_parser.parse(team_fields_to_parse)
-        riders_parser = TableParser(riders_table)
+        riders_parser = TableParser(results_table_html, rows=rider_rows)
         riders_parser.parse(rider_fields_to_parse)
 
-        # add time of every rider to the table
-        if "time" in fields:
+        parse_time = "time" in fields or "time_seconds" in fields
+        if parse_time:
             team_times = teams_parser.parse_extra_column("Time", format_time)
             # riders extra times from second HTML table column, if there is no
-            # extra time, time is set to None
+            # extra time, time is set to 0:00:00
             riders_extra_times = riders_parser.parse_extra_column(1,
                 lambda x: format_time(x.split("+")[1]) if
                 len(x.split("+")) >= 2 else "0:00:00")
-
-            riders_parser.extend_table("rider_time", riders_extra_times)
             teams_parser.extend_table("time", team_times)
+            riders_parser.extend_table("rider_time", riders_extra_times)
 
-            table = join_tables(riders_parser.table, teams_parser.table,
-                "rank")
-            # add team times and rider_extra times together and remove
-            # rider_time field from table
-            for row in table:
-                rider_extra_time = row.pop('rider_time')
-                row['time'] = add_times(row['time'], rider_extra_time)
-        else:
-            table = join_tables(riders_parser.table, teams_parser.table,
-                "rank")
+        teams = teams_parser.table
+        table = []
+        for rider, team_index in zip(riders_parser.table, riders_teams):
+            row = {**teams[team_index], **rider}
+            # add team time and rider extra time together
+            if parse_time:
+                seconds = time_to_seconds(row['time']) + \
+                    time_to_seconds(row.pop('rider_time'))
+                if "time" in fields:
+                    row['time'] = seconds_to_time(seconds)
+                else:
+                    row.pop('time')
+                if "time_seconds" in fields:
+                    row['time_seconds'] = seconds
+            table.append(row)
         # sort by name for consistent testing results (url is in fields by
         # default)
         table.sort(key = lambda x: x['rider_url'])
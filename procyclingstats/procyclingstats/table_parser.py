@@ -4,15 +4,96 @@ from selectolax.parser import Node
 import re
 
 from .errors import ExpectedParsingError, UnexpectedParsingError
-from .utils import add_times, format_time
+from .utils import (flag_nationality, format_time, seconds_to_time,
+                    table_to_columns, time_to_seconds)
+
+
+class TableCell:
+    """
+    Element of HTML table with lazily extracted and memoized values, so every
+    value is extracted from the DOM at most once.
+
+    :param node: HTML element.
+    """
+    __slots__ = ("node", "_class_attr", "_texts", "_href")
+
+    _missing = object()
+
+    def __init__(self, node: Node) -> None:
+        self.node = node
+        self._class_attr: Any = self._missing
+        self._texts: Optional[Dict[str, str]] = None
+        self._href: Any = self._missing
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.node.tag})"
+
+    @property
+    def class_attr(self) -> Optional[str]:
+        """Class attribute of the element."""
+        if self._class_attr is self._missing:
+            self._class_attr = self.node.attributes.get("class")
+        return self._class_attr
+
+    @property
+    def classes(self) -> List[str]:
+        """Classes of the element."""
+        return self.class_attr.split() if self.class_attr else []
+
+    @property
+    def href(self) -> Optional[str]:
+        """
+        Href of the element when it's a element, otherwise href of the first
+        a element in it. Empty string when there isn't any a element.
+        """
+        if self._href is self._missing:
+            if self.node.tag == "a":
+                self._href = self.node.attributes.get("href")
+            else:
+                a_element = self.node.css_first("a")
+                self._href = (a_element.attributes.get("href")
+                              if a_element else "")
+        return self._href
+
+    def text(self, separator: str = "") -> str:
+        """
+        Gets text of the element.
+
+        :param separator: Separator of texts of child elements, defaults to
+        empty string.
+        :return: Text of the element.
+        """
+        if self._texts is None:
+            self._texts = {}
+        text = self._texts.get(separator)
+        if text is None:
+            text = self._texts[separator] = self.node.text(
+                separator=separator)
+        return text
 
 
 class TableParser:
     """
-    Parser for HTML tables. Parsed content is stored in `self.table`, which is
-    represented as list of dicts.
+    Parser for HTML tables. Parsed content is available either as
+    `self.table`, which is represented as list of dicts, or as
+    `self.columns`, which is represented as dict of lists. Content is stored
+    in columns until `self.table` is accessed, so columnar output doesn't
+    create dict for every row.
+
+    Table rows are walked only once, when the first column is parsed. The
+    walk builds matrix of row cells (see `self.cells`) from which all columns
+    are then parsed, instead of querying the DOM for every column. Elements
+    with given class (e.g. ``.time``) are queried at most once too. Text and
+    href of every element are extracted only once.
 
     :param html_table: HTML table to be parsed from.
+    :param rows: Rows of the table to parse, defaults to None (all rows).
+        Elements outside of given rows are ignored, so one table can be
+        split to more parsers without modifying or copying the HTML.
+    :param row_filter: Predicate called with every row (as HTML element),
+        rows for which it returns False are skipped (e.g. rest days or sum
+        rows) the same way as rows that weren't given. Defaults to None (no
+        rows are skipped).
     """
 
     table_row_dict: Dict[str, str] = {
@@ -27,8 +108,14 @@ class TableParser:
     }
     """Finds out what is the table row column tag."""
 
-    def __init__(self, html_table: Node) -> None:
-        self.table = []
+    def __init__(self, html_table: Node,
+                 rows: Optional[List[Node]] = None,
+                 row_filter: Optional[Callable[[Node], bool]] = None) -> None:
+        self._table: Optional[List[Dict[str, Any]]] = []
+        self._columns: Dict[str, List[Any]] = {}
+        # fields of the table, so table without rows has columns too
+        self._fields: List[str] = []
+        self._rows_count = 0
         table_body = html_table.css_first("tbody")
         if table_body:
             self.html_table = table_body
@@ -41,9 +128,76 @@ class TableParser:
         self.row_column_tag = self.row_column_tag_dict[self.table_row_tag]
 
         self.a_elements = self.html_table.css("a")
-        self.table_length = len(self.html_table.css(self.table_row_tag))
-        self.row_length = len(self.html_table.css(
-            f"{self.table_row_tag}:first-child > {self.row_column_tag}"))
+        self._all_rows = rows is None and row_filter is None
+        if rows is None:
+            rows = self.html_table.css(self.table_row_tag)
+            self.row_length = len(self.html_table.css(
+                f"{self.table_row_tag}:first-child > {self.row_column_tag}"))
+        else:
+            self.row_length = len([child for child in rows[0].iter()
+                                   if child.tag == self.row_column_tag]
+                                  ) if rows else 0
+        if row_filter is not None:
+            rows = [row for row in rows if row_filter(row)]
+        self._rows = rows
+        self.table_length = len(self._rows)
+
+        self._row_indexes: Optional[Dict[int, int]] = None
+        self._cells: Optional[List[List[Optional[TableCell]]]] = None
+        self._class_index: Dict[str, List[TableCell]] = {}
+        self._anchors: Optional[Dict[str, Dict[int, List[TableCell]]]] = None
+        self._anchors_order: Dict[int, int] = {}
+        self._header_texts: Optional[List[str]] = None
+        self._header_indexes: Dict[str, int] = {}
+        self._column_indexes: Dict[str, Optional[int]] = {}
+        self._column_cells: Dict[int, List[TableCell]] = {}
+
+    @property
+    def cells(self) -> List[List[Optional[TableCell]]]:
+        """
+        Matrix of table cells, one list per table row. Cell is None when the
+        row child on that position isn't a column (e.g. ``th`` element in
+        ``tr`` row).
+        """
+        if self._cells is None:
+            self._cells = []
+            for row in self._rows:
+                row_cells = []
+                for child in row.iter():
+                    # skip comments
+                    if child.tag[0] in "_-":
+                        continue
+                    if child.tag == self.row_column_tag:
+                        row_cells.append(TableCell(child))
+                    else:
+                        row_cells.append(None)
+                self._cells.append(row_cells)
+        return self._cells
+
+    @property
+    def anchors(self) -> Dict[str, Dict[int, List[TableCell]]]:
+        """
+        Index of a elements by keywords of their hrefs (parts of href split by
+        ``/``, e.g. ``rider`` or ``team``). Every keyword maps indexes of table
+        rows to lists of matching a elements from the row. A elements without
+        href or outside of table rows aren't indexed.
+        """
+        if self._anchors is None:
+            self._anchors = {}
+            for order, a_element in enumerate(self.a_elements):
+                href = a_element.attributes.get("href")
+                if not href:
+                    continue
+                row_index = self._row_index(a_element)
+                if row_index is None:
+                    continue
+                cell = TableCell(a_element)
+                cell._href = href # pylint: disable=protected-access
+                self._anchors_order[id(cell)] = order
+                for keyword in set(href.split("/")):
+                    self._anchors.setdefault(keyword, {}).setdefault(
+                        row_index, []).append(cell)
+        return self._anchors
 
     def parse(self, fields: Union[List[str], Tuple[str, ...]]) -> None:
         """
@@ -67,6 +221,7 @@ class TableParser:
             - age
             - nationality
             - time
+            - time_seconds
             - bonus
             - profile_icon
             - season
@@ -86,10 +241,7 @@ class TableParser:
             - distance
             - date
         """
-        raw_table = []
-        for _ in range(self.table_length):
-            raw_table.append({})
-
+        columns = {}
         for field in fields:
             if field != "class":
                 parsed_field_list = getattr(self, field)()
@@ -102,16 +254,51 @@ class TableParser:
                 message = f"Field '{field}' wasn't parsed correctly"
                 raise UnexpectedParsingError(message)
 
-            for row, parsed_value in zip(raw_table, parsed_field_list):
-                row[field] = parsed_value
+            columns[field] = parsed_field_list
 
-        # remove unwanted rows
-        for row in raw_table:
-            self.table.append(row)
+        if self._rows_count_parsed():
+            # table was already parsed, so parsed rows are appended to it
+            self.table.extend(self._columns_to_rows(columns,
+                                                    self.table_length))
+        else:
+            self._table = None
+            self._columns = columns
+            self._rows_count = self.table_length
+            self._fields = list(fields)
 
-        if "time" in fields and self.table:
+        if "time" in fields and self._rows_count_parsed():
             self._make_times_absolute()
 
+    @property
+    def table(self) -> List[Dict[str, Any]]:
+        """
+        Parsed table as list of dicts, one dict for every row. Rows are
+        created on first access and changes made to them are reflected in
+        `self.columns` afterwards.
+        """
+        if self._table is None:
+            self._table = self._columns_to_rows(self._columns,
+                                                self._rows_count)
+            self._columns = {}
+        return self._table
+
+    @table.setter
+    def table(self, table: List[Dict[str, Any]]) -> None:
+        self._table = table
+        self._columns = {}
+
+    @property
+    def columns(self) -> Dict[str, List[Any]]:
+        """
+        Parsed table as dict of lists, one list with values of every row for
+        every field. Table without rows has empty list for every field.
+        """
+        if not self._rows_count_parsed():
+            return {field: [] for field in self._fields}
+        if self._table is None:
+            return self._columns
+        return table_to_columns(self._table)
+
     def extend_table(self, field_name: str, values: List[Any]):
         """
         Add given values to table.
@@ -120,15 +307,18 @@ class TableParser:
         :param values: Values which are being added.
         :raises ValueError: When values to add aren't the same length as table.
         """
-        if len(values) != len(self.table) and self.table:
+        rows_count = self._rows_count_parsed()
+        if len(values) != rows_count and rows_count:
             raise ValueError(
                 "Given values has to be the same length as table rows count")
-        if self.table:
-            for row, value in zip(self.table, values):
-                row[field_name] = value
-        else:
-            for value in values:
-                self.table.append({field_name: value})
+        if not rows_count and values:
+            self._table = None
+            self._columns = {}
+            self._rows_count = len(values)
+            self._fields = []
+        if field_name not in self._fields:
+            self._fields.append(field_name)
+        self._set_column(field_name, list(values))
 
     def parse_extra_column(self, index_or_header_value: Union[int, str],
                      func: Callable = int,
@@ -150,23 +340,27 @@ class TableParser:
             index = self._get_column_index_from_header(index_or_header_value)
         else:
             index = index_or_header_value
+        if get_href:
+            return [func(cell.href) for cell in self.column_cells(index)]
+        return [func(cell.text(separator))
+                for cell in self.column_cells(index)]
+
+    def column_cells(self, index: int) -> List[TableCell]:
+        """
+        Gets cells of given column from all rows that have it. Cells of every
+        column are collected only once.
+
+        :param index: Index of the column, negative indexing works too.
+        :return: List of column cells.
+        """
         if index < 0:
             index = self.row_length + index
-        elements = self.html_table.css(
-        f"{self.table_row_tag} > {self.row_column_tag}:nth-child({index+1})"
-        )
-
-        values = []
-        for element in elements:
-            text = element.text(separator=separator)
-            if get_href:
-                a_element = element.css_first("a")
-                if a_element:
-                    text = a_element.attributes['href']
-                else:
-                    text = ""
-            values.append(func(text))
-        return values
+        cells = self._column_cells.get(index)
+        if cells is None:
+            cells = self._column_cells[index] = [
+                row_cells[index] for row_cells in self.cells
+                if index < len(row_cells) and row_cells[index] is not None]
+        return cells
 
     def rider_url(self) -> List[str]:
         return self._filter_a_elements("rider", True)
@@ -195,9 +389,9 @@ class TableParser:
         return self._filter_a_elements("race", False, extras = {"national-race"})
 
     def nation_url(self) -> List[str]:
-        nations_urls = self._filter_a_elements("nation", True)
         # return only urls to nation overview, not `pcs-season-wins`
-        return [url for url in nations_urls if "pcs" not in url]
+        return self._filter_a_elements("nation", True,
+            lambda x: "pcs" not in x.href)
 
     def number_riders(self) -> List[str]:
         return self.parse_extra_column("#Riders", lambda x: int(x) if x.isnumeric() else None)
@@ -209,11 +403,10 @@ class TableParser:
         return self.parse_extra_column(3, str)
 
     def nation_name(self) -> List[str]:
-        nations_texts = self._filter_a_elements("nation", False)
         # return text only when is not numeric, so doesn't represent number of
         # wins of the nation
-        return [text for text in nations_texts
-                if not text.isnumeric() and text != "-"]
+        return self._filter_a_elements("nation", False,
+            lambda x: not x.text().isnumeric() and x.text() != "-")
 
     def year(self) -> List[str]:
         return self.parse_extra_column("Year", lambda x: int(x) if x.isnumeric() else None)
@@ -246,21 +439,21 @@ class TableParser:
         return self._filter_a_elements("location", False)
 
     def age(self) -> List[Optional[int]]:
-        ages_elements = self.html_table.css(".age")
+        ages_elements = self._by_class("age")
         return [int(age_e.text()) if age_e.text() else None
             for age_e in ages_elements]
 
     def nationality(self) -> List[str]:
-        flags_elements = self.html_table.css(".flag")
+        flags_elements = self._by_class("flag")
         flags = []
         for flag_e in flags_elements:
-            if (flag_e.attributes['class'] and
-                    " " in flag_e.attributes['class']):
-                flags.append(flag_e.attributes['class'].split(" ")[1].upper())
+            nationality = flag_nationality(flag_e.class_attr)
+            if nationality is not None:
+                flags.append(nationality)
         return flags
 
     def time(self) -> List[Optional[str]]:
-        times_elements = self.html_table.css(".time")
+        times_elements = self._by_class("time")
         times = []
         for time_e in times_elements:
             time_e_text = time_e.text(separator="\n")
@@ -276,6 +469,9 @@ class TableParser:
             times.append(rider_time)
         return times
 
+    def time_seconds(self) -> List[Optional[int]]:
+        return self._absolute_seconds(self.time())
+
     def number_of_wins(self) -> List[int]:
         possible_columns = ["Total", "#"]
         for column_name in possible_columns:
@@ -302,7 +498,7 @@ class TableParser:
 
         :return: List of bonuses.
         """
-        bonuses_elements = self.html_table.css(".bonis")
+        bonuses_elements = self._by_class("bonis")
         bonuses = []
         for bonus_e in bonuses_elements:
             bonus = bonus_e.text().replace("″", "").replace(" ", "")
@@ -330,10 +526,10 @@ class TableParser:
     def profile_icon(self) -> List[Literal[
         "p0", "p1", "p2", "p3", "p4", "p5"
     ]]:
-        icons_elements = self.html_table.css(".icon.profile")
+        icons_elements = self._by_class("icon", "profile")
         profiles = []
         for icon_e in icons_elements:
-            classes = icon_e.attributes['class']
+            classes = icon_e.class_attr
             if classes and len(classes.split(" ")) >= 3:
                 profiles.append(classes.split(" ")[-1])
         return profiles
@@ -345,7 +541,7 @@ class TableParser:
 
         :return: List of seasons.
         """
-        seasons_elements = self.html_table.css(".season")
+        seasons_elements = self._by_class("season")
         seasons = []
         for season_e in seasons_elements:
             season_e_text = season_e.text()
@@ -358,7 +554,7 @@ class TableParser:
         return seasons
 
     def rider_number(self) -> List[Optional[int]]:
-        bibs_elements = self.html_table.css(".bibs")
+        bibs_elements = self._by_class("bibs")
         return [int(bib_e.text()) if bib_e.text().isnumeric() else None \
             for bib_e in bibs_elements]
 
@@ -448,80 +644,221 @@ class TableParser:
         :param field_name: Original field name.
         :param new_field_name: New name of original field.
         """
-        for row in self.table:
+        if self._table is None:
+            self._columns[new_field_name] = self._columns.pop(field_name)
+            return
+        for row in self._table:
             value = row.pop(field_name)
             row[new_field_name] = value
 
     def _get_column_index_from_header(self, column_name: str) -> int:
+        """
+        Finds index of the first column whose header contains given column
+        name (case insensitive). Header texts are extracted only once and
+        found indexes are memoized. Header that is exactly the column name is
+        looked up first, then only headers before it are searched for the
+        name as substring, otherwise all headers are searched.
+
+        :param column_name: Column name to find.
+        :raises ExpectedParsingError: When table doesn't have a header.
+        :raises ValueError: When there isn't such column in the header.
+        :return: Index of the column.
+        """
         if self.header is None:
             raise ExpectedParsingError(
                 f"Can not parse '{column_name}' column without table header")
-        for i, column_name_e in enumerate(self.header.css("th")):
-            if column_name.lower() in column_name_e.text().lower():
-                return i
-        raise ValueError(
-            f"'{column_name}' column isn't in table header")
+        if self._header_texts is None:
+            self._header_texts = [th.text().lower()
+                                  for th in self.header.css("th")]
+            for i, header_text in enumerate(self._header_texts):
+                self._header_indexes.setdefault(header_text.strip(), i)
+        key = column_name.lower()
+        if key in self._column_indexes:
+            index = self._column_indexes[key]
+        else:
+            exact_index = self._header_indexes.get(key)
+            # preceding header containing the name is still the first match
+            end = len(self._header_texts) if exact_index is None \
+                else exact_index
+            index = next((i for i in range(end)
+                          if key in self._header_texts[i]), exact_index)
+            self._column_indexes[key] = index
+        if index is None:
+            raise ValueError(
+                f"'{column_name}' column isn't in table header")
+        return index
+
+    def _by_class(self, *classes: str) -> List[TableCell]:
+        """
+        Finds all elements from the table that have all given classes.
+        Elements with the same classes are queried only once.
+
+        :param classes: Classes the elements have to have.
+        :return: Elements in document order.
+        """
+        selector = "".join(f".{class_}" for class_ in classes)
+        elements = self._class_index.get(selector)
+        if elements is None:
+            elements = self._class_index[selector] = [
+                TableCell(node) for node in self.html_table.css(selector)
+                if self._all_rows or self._row_index(node) is not None]
+        return elements
+
+    def _row_index(self, node: Node) -> Optional[int]:
+        """
+        Finds the closest parsed table row containing given element.
+
+        :param node: Element of the table.
+        :return: Index of the row, None when the element isn't in any of
+            parsed rows.
+        """
+        if self._row_indexes is None:
+            self._row_indexes = {row.mem_id: i
+                                 for i, row in enumerate(self._rows)}
+        while node is not None and node.mem_id not in self._row_indexes:
+            node = node.parent
+        return None if node is None else self._row_indexes[node.mem_id]
 
     def _make_times_absolute(self, time_field: str = "time") -> None:
         """
         Sums all times from table with first time from table. Table has to have
-        at least 2 rows.
+        at least 2 rows. Times are summed as integer seconds and formatted to
+        `H:MM:SS` format afterwards.
 
         :param time_field: Field which represents wanted time, defaults to
         `time`.
         """
-        # reformat times from . separators to :
-        for row in self.table:
-            try:
-                if "." in row[time_field]:
-                    [minutes, seconds] = row[time_field].split(".")
-                    row[time_field] = format_time(minutes + ":" + seconds[:2])
-            except Exception:
-                # mark bad times
-                row[time_field] = ""
-
-        first_time = self.table[0][time_field]
-        for i, row in enumerate(self.table[1:]):
-            if row[time_field]:
-                    row[time_field] = add_times(first_time, row[time_field])
+        seconds = self._absolute_seconds(self._get_column(time_field))
+        self._set_column(time_field, [seconds_to_time(time_)
+                                      if time_ is not None else ""
+                                      for time_ in seconds])
+
+    @classmethod
+    def _absolute_seconds(cls, times: List[Optional[str]]
+                          ) -> List[Optional[int]]:
+        """
+        Converts times parsed from the table to seconds and adds the first
+        time to all the others, which are gaps to it. Missing time (e.g. same
+        time as previous rider) is the time of previous row.
+
+        :param times: Times parsed from the table, the first one is absolute.
+        :return: Absolute times in seconds, the first one is None when it's
+            missing.
+        """
+        seconds = [cls._time_to_seconds(time_) for time_ in times]
+        first_time = seconds[0] if seconds[0] is not None else 0
+        # missing times (e.g. same time as prev rider) are None
+        for i in range(1, len(seconds)):
+            if seconds[i] is not None:
+                seconds[i] += first_time
+            elif i == 1:
+                seconds[i] = 0
             else:
-                if i == 0:
-                    row[time_field] = "0:00:00"
-                else:
-                    # set same time as prev rider
-                    row[time_field] = self.table[1:][i - 1][time_field]
+                seconds[i] = seconds[i - 1]
+        return seconds
+
+    @staticmethod
+    def _time_to_seconds(time_: Optional[str]) -> Optional[int]:
+        """
+        Converts time parsed from the table to seconds. Time can be also in
+        `M.SS` format.
+
+        :param time_: Time to convert.
+        :return: Count of seconds, None when the time is missing or invalid.
+        """
+        if not time_:
+            return None
+        try:
+            if "." in time_:
+                minutes, seconds = time_.split(".")
+                time_ = minutes + ":" + seconds[:2]
+            return time_to_seconds(time_)
+        except ValueError:
+            return None
+
+    def _rows_count_parsed(self) -> int:
+        """
+        Gets count of parsed rows without creating them.
+
+        :return: Count of rows of parsed table.
+        """
+        if self._table is None:
+            return self._rows_count
+        return len(self._table)
 
+    def _get_column(self, field: str) -> List[Any]:
+        """
+        Gets values of given field from all rows.
+
+        :param field: Field to get.
+        :return: List of values, changing it doesn't change the table.
+        """
+        if self._table is None:
+            return list(self._columns[field])
+        return [row[field] for row in self._table]
+
+    def _set_column(self, field: str, values: List[Any]) -> None:
+        """
+        Sets values of given field in all rows.
+
+        :param field: Field to set.
+        :param values: Values for every row.
+        """
+        if self._table is None:
+            self._columns[field] = values
+            return
+        for row, value in zip(self._table, values):
+            row[field] = value
+
+    @staticmethod
+    def _columns_to_rows(columns: Dict[str, List[Any]],
+                         rows_count: int) -> List[Dict[str, Any]]:
+        """
+        Makes list of dicts from columns.
+
+        :param columns: Dict of lists of the same length.
+        :param rows_count: Count of rows, needed when there are no columns.
+        :return: List of dicts.
+        """
+        if not columns:
+            return [{} for _ in range(rows_count)]
+        fields = list(columns)
+        return [dict(zip(fields, values))
+                for values in zip(*columns.values())]
 
     def _filter_a_elements(self, keyword: str, get_href: bool,
                            validator: Callable = lambda x: True,
-                           extras: Optional[Set[str]] = None) -> List[str]:
+                           extras: Optional[Set[str]] = None
+                           ) -> List[Optional[str]]:
         """
-        Filters from all a elements these which has at the beggining of their
-        href given keyword and gets their href or text.
+        Finds in every table row the first a element which has given keyword
+        in its href and gets its href or text.
 
         :param keyword: Keyword that element's href should have.
         :param get_href: Whether to return the href of a element, when False
         text is returned.
-        :param validator: Function to call on every a element. When returns
-        True element is added to result list, otherwise not.
+        :param validator: Function to call on every matching a element (as
+        `TableCell`). When returns False, element is skipped.
         :param extras: Extra keywords to match.
-        :return: List of all a elements texts or hrefs with given keyword.
+        :return: List with href or text for every table row, None for rows
+        without matching a element.
         """
-        if not extras:
-            extras = {keyword}
-        else:
-            extras.add(keyword)
+        keywords = {keyword} | extras if extras else {keyword}
+        keyword_rows = [self.anchors[kwrd] for kwrd in keywords
+                        if kwrd in self.anchors]
         filtered_values = []
-        for a_element in self.a_elements:
-            href = a_element.attributes['href']
-            if href and validator(a_element):
-                parts = set(href.split("/"))
-                for kwrd in extras:
-                    if kwrd in parts:
-                        if get_href:
-                            filtered_values.append(href)
-                        else:
-                            filtered_values.append(a_element.text())
-        while len(filtered_values) != self.table_length:
-            filtered_values.append(None)
+        for i in range(self.table_length):
+            if len(keyword_rows) == 1:
+                row_a_elements = keyword_rows[0].get(i, [])
+            else:
+                row_a_elements = sorted(
+                    {id(a): a for rows in keyword_rows
+                     for a in rows.get(i, [])}.values(),
+                    key=lambda a: self._anchors_order[id(a)])
+            value = None
+            for a_element in row_a_elements:
+                if validator(a_element):
+                    value = a_element.href if get_href else a_element.text()
+                    break
+            filtered_values.append(value)
         return filtered_values
@@ -1,9 +1,10 @@
-from typing import Any, Dict, List, Optional
+from typing import (Any, Callable, Dict, Iterator, List, Optional, Tuple,
+                    Union)
+
+from selectolax.parser import Node
 
 from .scraper import Scraper
-from .table_parser import TableParser
-from .utils import (get_day_month, join_tables, parse_select,
-                    parse_table_fields_args)
+from .utils import get_day_month, parse_select, parse_table_fields_args
 
 
 class Team(Scraper):
@@ -148,7 +149,30 @@ class Team(Scraper):
         team_seasons_select_html = self.html.css_first("form > select")
         return parse_select(team_seasons_select_html)
 
-    def riders(self, *args: str) -> List[Dict[str, Any]]:
+    _riders_tabs_columns: Dict[str, Tuple[
+        Tuple[str, int, Callable[[str], Any]], ...]] = {
+        "points": (
+            ("career_points", 2, lambda x: int(x) if x.isnumeric() else 0),
+        ),
+        "age": (
+            ("age", 2, lambda x: int(x[:2])),
+        ),
+        "ranking": (
+            ("ranking_points", 2,
+             lambda x: int(x.strip("()")) if x.strip("()").isnumeric() else 0),
+            ("ranking_position", 3, lambda x: int(x) if x.isnumeric() else None)
+        ),
+        "name": (
+            ("since", 2,
+             lambda x: get_day_month(x) if "as from" in x else "01-01"),
+            ("until", 2,
+             lambda x: get_day_month(x) if "until" in x else "12-31")
+        )
+    }
+    """Fields parsed from riders tabs as (field, column index, parser)."""
+
+    def riders(self, *args: str, as_columns: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Parses team riders in curresponding season from HTML.
 
@@ -167,6 +191,9 @@ class Team(Scraper):
             - ranking_points: Current rider's points in PCS ranking.
             - ranking_position: Current rider's position in PCS ranking.
 
+        :param as_columns: Whether to return the table as dict of lists
+            (field to values of all rows) instead of list of dicts, defaults
+            to False.
         :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
@@ -181,73 +208,71 @@ class Team(Scraper):
             "ranking_points",
             "ranking_position"
         )
-        casual_fields = [
-            "nationality",
-            "rider_name",
-            "rider_url"]
-        mapping = {}
-        for i, li in enumerate(self.html.css("ul.riderlistTabs > li")):
-            mapping[li.text()] = i
-        all_tables = self.html.css("div.ridersTab")
-
         fields = parse_table_fields_args(args, available_fields)
-        career_points_table_html = all_tables[mapping["points"]]
-        table_parser = TableParser(career_points_table_html)
-        career_points_fields = [field for field in fields
-                         if field in casual_fields]
-        # add rider_url to the table for table joining purposes
-        if "rider_url" not in career_points_fields:
-            career_points_fields.append("rider_url")
-        table_parser.parse(career_points_fields)
-        if "career_points" in fields:
-            career_points = table_parser.parse_extra_column(2,
-                lambda x: int(x) if x.isnumeric() else 0)
-            table_parser.extend_table("career_points", career_points)
-        table = table_parser.table
-
-        # add ages to the table if needed
-        if "age" in fields:
-            ages_table_html = all_tables[mapping["age"]]
-            ages_tp = TableParser(ages_table_html)
-            ages_tp.parse(["rider_url"])
-            ages = ages_tp.parse_extra_column(2, lambda x: int(x[:2]))
-            ages_tp.extend_table("age", ages)
-            table = join_tables(table, ages_tp.table, "rider_url")
-
-        # add ranking points and positions to the table if needed
-        if "ranking_position" in fields or "ranking_points" in fields:
-            ranking_table_html = all_tables[mapping["ranking"]]
-            ranking_tp = TableParser(ranking_table_html)
-            ranking_tp.parse(["rider_url"])
-            if "ranking_points" in fields:
-                points = ranking_tp.parse_extra_column(2,
-                    lambda x: int(x.replace("(", "").replace(")", ""))
-                    if x.replace("(", "").replace(")", "").isnumeric() else 0)
-                ranking_tp.extend_table("ranking_points", points)
-            if "ranking_position" in fields:
-                positions = ranking_tp.parse_extra_column(3,
-                    lambda x: int(x) if x.isnumeric() else None)
-                ranking_tp.extend_table("ranking_position", positions)
-            table = join_tables(table, ranking_tp.table, "rider_url")
-
-        # add rider's since and until dates to the table if needed
-        if "since" in fields or "until" in fields:
-            since_until_html_table = all_tables[mapping["name"]]
-            since_tp = TableParser(since_until_html_table)
-            since_tp.parse(["rider_url"])
-            if "since" in fields:
-                since_dates = since_tp.parse_extra_column(2,
-                    lambda x: get_day_month(x) if "as from" in x else "01-01")
-                since_tp.extend_table("since", since_dates)
-            if "until" in fields:
-                until_dates = since_tp.parse_extra_column(2,
-                    lambda x: get_day_month(x) if "until" in x else "12-31")
-                since_tp.extend_table("until", until_dates)
-            table = join_tables(table, since_tp.table, "rider_url")
-
-        # remove rider_url field if wasn't requested and was used for joining
-        # tables only
-        if "rider_url" not in fields:
-            for row in table:
-                row.pop("rider_url")
-        return table
+        tabs = {}
+        for li, tab_html in zip(self.html.css("ul.riderlistTabs > li"),
+                                self.html.css("div.ridersTab")):
+            tabs[li.text()] = tab_html
+
+        # points tab determines order of the riders, other tabs only fill
+        # wanted fields of riders from the points tab
+        rows: Dict[str, Dict[str, Any]] = {}
+        table = []
+        for tab, columns in self._riders_tabs_columns.items():
+            wanted_columns = [(field, index, func)
+                              for field, index, func in columns
+                              if field in fields]
+            if tab != "points" and not wanted_columns:
+                continue
+            for rider_url, rider_name, nationality, cells in \
+                    self._riders_tab_rows(tabs[tab]):
+                if tab == "points":
+                    row = dict.fromkeys(fields)
+                    if "rider_url" in row:
+                        row["rider_url"] = rider_url
+                    if "rider_name" in row:
+                        row["rider_name"] = rider_name
+                    if "nationality" in row:
+                        row["nationality"] = nationality
+                    table.append(row)
+                    if rider_url is not None:
+                        rows[rider_url] = row
+                else:
+                    row = rows.get(rider_url) # type: ignore
+                    if row is None:
+                        continue
+                for field, index, func in wanted_columns:
+                    if index < len(cells):
+                        row[field] = func(cells[index].text())
+        return self._table_output(table, as_columns, fields)
+
+    @staticmethod
+    def _riders_tab_rows(tab_html: Node) -> Iterator[Tuple[
+            Optional[str], Optional[str], Optional[str], List[Node]]]:
+        """
+        Walks rows of riders tab table, every row is walked only once.
+
+        :param tab_html: HTML of `div.ridersTab` element.
+        :return: Generator of rider URL, rider name, nationality and cells of
+            every row. URL, name and nationality are None when not in the row.
+        """
+        for tr in tab_html.css("tbody > tr"):
+            cells = []
+            rider_url, rider_name, nationality = None, None, None
+            # flag and rider's a element are children of table cells, so
+            # whole subtree of the row doesn't have to be traversed
+            for cell in tr.iter():
+                if cell.tag != "td":
+                    continue
+                cells.append(cell)
+                for node in cell.iter():
+                    tag = node.tag
+                    if tag == "a" and rider_url is None:
+                        href = node.attributes.get("href")
+                        if href and "rider" in href.split("/"):
+                            rider_url, rider_name = href, node.text()
+                    elif tag == "span" and nationality is None:
+                        classes = (node.attributes.get("class") or "").split()
+                        if "flag" in classes and len(classes) > 1:
+                            nationality = classes[1].upper()
+            yield rider_url, rider_name, nationality, cells
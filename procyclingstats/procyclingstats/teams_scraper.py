@@ -1,9 +1,12 @@
-from typing import List
+from typing import List, Optional
+from .cache import HTMLCache
 from .scraper import Scraper
+from .session import HTTPSession
 
 class Teams(Scraper):
-    def __init__(self):
-        super().__init__('teams.php?year=2025&filter=Filter&s=worldtour', update_html=False);
+    def __init__(self, session: Optional[HTTPSession] = None,
+                 cache: Optional[HTMLCache] = None):
+        super().__init__('teams.php?year=2025&filter=Filter&s=worldtour', update_html=False, session=session, cache=cache);
 
     def teams(self, year: int) -> List[str]:
         self.year = year
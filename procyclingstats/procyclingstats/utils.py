@@ -1,7 +1,9 @@
+import codecs
 import datetime
 import math
 import re
 from typing import Any, Dict, List, Tuple, Union, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from selectolax.parser import HTMLParser, Node
 
@@ -55,16 +57,7 @@ def timedelta_to_time(tdelta: datetime.timedelta) -> str:
     :param tdelta: Timedelta to convert.
     :return: Formatted time.
     """
-    time = str(tdelta).split(" ")
-    if len(time) > 1:
-        days = time[0]
-        time = time[2]
-        hours = int(time.split(":")[0]) + (24 * int(days))
-        minutes_seconds = ":".join(time.split(":")[1:])
-    else:
-        hours = time[0].split(":")[0]
-        minutes_seconds = ":".join(time[0].split(":")[1:])
-    return f"{hours}:{minutes_seconds}"
+    return seconds_to_time(int(tdelta.total_seconds()))
 
 def time_to_timedelta(time: str) -> datetime.timedelta:
     """
@@ -76,6 +69,33 @@ def time_to_timedelta(time: str) -> datetime.timedelta:
     [hours, minutes, seconds] = [int(value) for value in time.split(":")]
     return datetime.timedelta(hours=hours, minutes=minutes, seconds=seconds)
 
+def time_to_seconds(time: str) -> int:
+    """
+    Converts time in `H:MM:SS`, `M:SS` or `SS` format to seconds. Time
+    starting with `-` (e.g. penalty) is converted to negative seconds.
+
+    :param time: Time to convert.
+    :return: Count of seconds.
+    """
+    sign = -1 if time.startswith("-") else 1
+    seconds = 0
+    for value in time.lstrip("-").split(":"):
+        seconds = seconds * 60 + int(value)
+    return sign * seconds
+
+def seconds_to_time(seconds: int) -> str:
+    """
+    Converts seconds to time in `H:MM:SS` format, negative seconds are
+    converted to `-H:MM:SS`.
+
+    :param seconds: Count of seconds.
+    :return: Formatted time e.g. `31:03:11`.
+    """
+    sign = "-" if seconds < 0 else ""
+    minutes, seconds = divmod(abs(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{sign}{hours}:{minutes:02d}:{seconds:02d}"
+
 def format_time(time: str) -> str:
     """
     Convert time from `M:SS` or `MM:SS` format to `H:MM:SS` format.
@@ -103,10 +123,7 @@ def add_times(time1: str, time2: str) -> str:
     :param time2: Time separated with colons.
     :return: Time in `H:MM:SS` format.
     """
-    tdelta1 = time_to_timedelta(format_time(time1))
-    tdelta2 = time_to_timedelta(format_time(time2))
-    tdelta = tdelta1 + tdelta2
-    return timedelta_to_time(tdelta)
+    return seconds_to_time(time_to_seconds(time1) + time_to_seconds(time2))
 
 # HTML parsing functions
 def parse_select(select_menu: Node) -> List[Dict[str, str]]:
@@ -140,8 +157,105 @@ def select_menu_by_name(html: Union[Node, HTMLParser], name_attr: str) -> Node:
         raise ExpectedParsingError(f"'{name_attr}' select not in page HTML.")
     return select_html
 
+def flag_nationality(flag_class: Optional[str]) -> Optional[str]:
+    """
+    Gets nationality from class attribute of flag element e.g. `flag si`.
+
+    :param flag_class: Class attribute of the flag element.
+    :return: Nationality as 2 chars long uppercase country code, None when
+    the flag doesn't have it.
+    """
+    if not flag_class or " " not in flag_class:
+        return None
+    return flag_class.split(" ")[1].upper()
+
+def parse_html(html: Union[str, bytes],
+               encoding: Optional[str] = None) -> HTMLParser:
+    """
+    Creates HTMLParser object from given HTML. UTF-8 bytes are passed to the
+    parser as they are, without decoding them to string first.
+
+    :param html: HTML either as string or as bytes.
+    :param encoding: Encoding of the HTML when given as bytes, defaults to
+    None. When None, it's found by `sniff_encoding`.
+    :return: HTMLParser object.
+    """
+    if isinstance(html, str):
+        return HTMLParser(html)
+    if encoding is None:
+        encoding = sniff_encoding(html)
+    if codecs.lookup(encoding).name in ("utf-8", "ascii"):
+        return HTMLParser(html, detect_encoding=False)
+    return HTMLParser(html.decode(encoding, errors="replace"))
+
+_CHARSET_REGEX = re.compile(rb"""charset=["']?([\w.:-]+)""", re.IGNORECASE)
+
+def sniff_encoding(body: bytes, content_type: Optional[str] = None) -> str:
+    """
+    Finds encoding of HTML page without decoding it. Charset from
+    ``Content-Type`` header is preferred, otherwise charset from meta tag at
+    the beginning of the page is used.
+
+    :param body: Raw HTML of the page.
+    :param content_type: ``Content-Type`` header of the response, defaults to
+    None.
+    :return: Name of the encoding, ``utf-8`` when it can't be found or isn't
+    known.
+    """
+    candidates = []
+    if content_type:
+        candidates.append(_CHARSET_REGEX.search(
+            content_type.encode("latin-1", "replace")))
+    candidates.append(_CHARSET_REGEX.search(body[:1024]))
+    for match in candidates:
+        if match is None:
+            continue
+        try:
+            return codecs.lookup(match.group(1).decode("ascii")).name
+        except LookupError:
+            continue
+    return "utf-8"
+
 
 # other functions
+def canonical_url(url: str) -> str:
+    """
+    Makes canonical form of given absolute URL, so URLs of the same page are
+    equal. Scheme and host are lowercased, fragment and trailing slashes are
+    removed and query parameters are sorted.
+
+    :param url: Absolute URL.
+    :return: Canonical URL.
+    """
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip("/") or "/"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path,
+                       query, ""))
+
+def table_to_columns(table: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """
+    Converts table represented as list of dicts to dict of lists. Fields are
+    taken from the first row, missing values are None.
+
+    :param table: Table to convert.
+    :return: Dict with list of values for every field.
+    """
+    if not table:
+        return {}
+    return {field: [row.get(field) for row in table] for field in table[0]}
+
+def columns_to_table(columns: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """
+    Converts table represented as dict of lists to list of dicts.
+
+    :param columns: Dict with list of values for every field, all lists have
+    to be of the same length.
+    :return: List of dicts, one for every row.
+    """
+    fields = list(columns)
+    return [dict(zip(fields, values)) for values in zip(*columns.values())]
+
 def join_tables(table1: List[Dict[str, Any]],
                table2: List[Dict[str, Any]],
                join_key: str,
@@ -168,18 +282,22 @@ def join_tables(table1: List[Dict[str, Any]],
     return table
 
 def parse_table_fields_args(args: Tuple[str],
-                            available_fields: Tuple[str, ...]) -> List[str]:
+                            available_fields: Tuple[str, ...],
+                            optional_fields: Tuple[str, ...] = ()
+                            ) -> List[str]:
     """
     Check whether given args are valid and get table fields.
 
     :param args: Args to be validated.
     :param available_fields: Args that would be valid.
+    :param optional_fields: Args that would be valid too, but aren't among
+    table fields when no args are given, defaults to empty tuple.
     :raises ValueError: When one of args is not valid.
     :return: Table fields, args if any were given, otherwise all available
     fields.
     """
     for arg in args:
-        if arg not in available_fields:
+        if arg not in available_fields and arg not in optional_fields:
             raise ValueError("Invalid field argument")
     if args:
         return list(args)
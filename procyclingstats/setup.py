@@ -20,4 +20,8 @@ setup(
         "requests",
         "selectolax"
     ],
+    extras_require={
+        "pandas": ["pandas"],
+        "arrow": ["pyarrow"]
+    },
 )
@@ -0,0 +1,64 @@
+import json
+import os
+import subprocess
+import sys
+from typing import Any
+
+import pytest
+
+from .import_test import DATA_DIR, PACKAGE_DIR
+
+CONVERT_COUNTRIES = """
+import json
+import sys
+
+import data
+
+converted = {
+    "csv": [data.convert_country("great-britain", "ISO2"),
+            data.convert_country("GB", "ISOnumeric"),
+            data.convert_country("slovenia", "name_short"),
+            data.convert_country("SI", "ISOnumeric"),
+            data.convert_country("NL", "name_short", src="ISO2")],
+    "csv_imports_coco": "country_converter" in sys.modules,
+    "fallback": [data.convert_country("SI", "ISO3"),
+                 data.convert_country("DEU", "ISO2", src="ISO3"),
+                 data.convert_country("atlantis", "ISO2")],
+    "coco": [data.get_country_converter().convert(names="SI", to="ISO3"),
+             data.get_country_converter().convert(names="DEU", src="ISO3",
+                                                  to="ISO2"),
+             data.get_country_converter().convert(names="atlantis",
+                                                  to="ISO2")]
+}
+print(json.dumps(converted))
+"""
+
+
+def run_in_data_dir(code: str, cwd: str) -> Any:
+    """
+    Runs given code in new interpreter which can import data loaders module.
+
+    :param code: Code to run, it has to print JSON to stdout.
+    :param cwd: Directory to run the interpreter in.
+    :return: Parsed JSON printed by the code.
+    """
+    env = {**os.environ,
+           "PYTHONPATH": os.pathsep.join((DATA_DIR, PACKAGE_DIR))}
+    process = subprocess.run([sys.executable, "-c", code], cwd=cwd, env=env,
+                             capture_output=True, text=True, check=True)
+    return json.loads(process.stdout.splitlines()[-1])
+
+
+def test_convert_country(tmp_path) -> None:
+    # data.py is run in another interpreter, so it doesn't configure the
+    # session, the cache and the rate limiter of this one
+    if not os.path.isfile(os.path.join(DATA_DIR, "data.py")):
+        pytest.skip("data loaders aren't available")
+    pytest.importorskip("diskcache")
+    pytest.importorskip("country_converter")
+    converted = run_in_data_dir(CONVERT_COUNTRIES, str(tmp_path))
+    assert converted["csv"] == ["GB", 826, "Slovenia", 705, "Netherlands"]
+    # names found in countries.csv don't need country_converter
+    assert not converted["csv_imports_coco"]
+    assert converted["fallback"] == converted["coco"] == \
+        ["SVN", "DE", "not found"]
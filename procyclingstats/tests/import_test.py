@@ -0,0 +1,66 @@
+import os
+import subprocess
+import sys
+from typing import Dict, List
+
+import pytest
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+DATA_DIR = os.path.join(os.path.dirname(PACKAGE_DIR), "src", "data")
+
+
+def import_times(module: str, cwd: str, path: str,
+                 repeat: int = 3) -> Dict[str, int]:
+    """
+    Imports given module in new interpreter with ``-X importtime``.
+
+    :param module: Name of the module to import.
+    :param cwd: Directory to run the interpreter in.
+    :param path: Directory with the module, added to ``PYTHONPATH``.
+    :param repeat: Number of interpreters to import the module in, the
+        fastest import of every module is kept. Defaults to 3.
+    :return: Cumulative import time in microseconds of every imported module.
+    """
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join((path, PACKAGE_DIR))}
+    times: Dict[str, int] = {}
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=cwd, env=env, capture_output=True, text=True, check=True)
+        for line in process.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line.split("|")
+            name = name.strip()
+            times[name] = min(times.get(name, int(cumulative)),
+                              int(cumulative))
+    return times
+
+
+def assert_lazy(times: Dict[str, int], module: str, budget: int,
+                not_imported: List[str]) -> None:
+    for name in not_imported:
+        assert name not in times, f"'import {module}' imports {name}"
+    assert times[module] <= budget, \
+        f"'import {module}' took {times[module]} us, budget is {budget} us"
+
+
+def test_package_import_time(tmp_path) -> None:
+    times = import_times("procyclingstats", str(tmp_path), PACKAGE_DIR)
+    assert_lazy(times, "procyclingstats", 50_000,
+                ["requests", "selectolax", "procyclingstats.scraper"])
+
+
+def test_data_import_time(tmp_path) -> None:
+    # loaders are run as scripts from src/data, so `import data` imports
+    # data.py, which opens the memoization caches in working directory and
+    # configures the session and the HTML cache, but doesn't make requests
+    if not os.path.isfile(os.path.join(DATA_DIR, "data.py")):
+        pytest.skip("data loaders aren't available")
+    pytest.importorskip("diskcache")
+    times = import_times("data", str(tmp_path), DATA_DIR)
+    # about 150 ms, mostly opening the memoization caches, importing requests
+    # alone takes about 100 ms more
+    assert_lazy(times, "data", 200_000,
+                ["requests", "selectolax", "procyclingstats.scraper",
+                 "country_converter", "pandas"])
@@ -1,6 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
 from procyclingstats import (Race, RaceClimbs, RaceStartlist, Ranking, Rider,
-                             RiderResults, Stage, Team)
+                             RiderResults, Stage, Team, to_arrow, to_frame)
+from procyclingstats.table_parser import TableParser
+from procyclingstats.utils import (parse_html, table_to_columns,
+                                  time_to_seconds)
 
+from .fixtures_utils import FixturesUtils
 from .scraper_test_base_class import ScraperTestBaseClass
 
 
@@ -28,3 +36,124 @@ class TestTeam(ScraperTestBaseClass):
 class TestRace(ScraperTestBaseClass):
     ScraperClass = Race
 
+
+def test_table_as_columns() -> None:
+    f_utils = FixturesUtils(fixtures_path="tests/fixtures/")
+    for stage in f_utils.get_scraper_objects_from_fixtures(Stage):
+        results = stage.results()
+        columns = stage.results(as_columns=True)
+        assert columns == table_to_columns(results)
+        if results:
+            assert list(columns) == list(results[0])
+            assert all(len(values) == len(results)
+                       for values in columns.values())
+
+def test_time_seconds() -> None:
+    f_utils = FixturesUtils(fixtures_path="tests/fixtures/")
+    for stage in f_utils.get_scraper_objects_from_fixtures(Stage):
+        for method in (stage.results, stage.gc, stage.youth, stage.teams):
+            assert all("time_seconds" not in row for row in method())
+            columns = method("time", "time_seconds", as_columns=True)
+            assert columns["time_seconds"] == [
+                time_to_seconds(time) if time else None
+                for time in columns["time"]]
+
+def test_empty_table_as_columns() -> None:
+    f_utils = FixturesUtils(fixtures_path="tests/fixtures/")
+    for race in f_utils.get_scraper_objects_from_fixtures(Race):
+        if race.is_one_day_race():
+            assert race.stages("date", "stage_url", as_columns=True) == \
+                {"date": [], "stage_url": []}
+    for stage in f_utils.get_scraper_objects_from_fixtures(Stage):
+        if stage.is_one_day_race():
+            assert stage.gc("rank", "rider_name", as_columns=True) == \
+                {"rank": [], "rider_name": []}
+
+def test_column_index_from_header() -> None:
+    html = parse_html("<table><thead><tr><th>Team time</th><th>Time</th>" +
+                      "<th> Pnt </th><th>UCI</th><th>Pnt</th></tr></thead>" +
+                      "<tbody><tr><td>1</td><td>2</td><td>3</td><td>4</td>" +
+                      "<td>5</td></tr></tbody></table>")
+    table_parser = TableParser(html.css_first("table"))
+    # the first header containing the name is used even if another header is
+    # exactly the name
+    assert table_parser.parse_extra_column("Time", int) == [1]
+    assert table_parser.parse_extra_column("pnt", int) == [3]
+    assert table_parser.parse_extra_column("uci", int) == [4]
+    with pytest.raises(ValueError):
+        table_parser.parse_extra_column("Rnk", int)
+
+def test_table_to_frame() -> None:
+    pd = pytest.importorskip("pandas")
+    f_utils = FixturesUtils(fixtures_path="tests/fixtures/")
+    stage = f_utils.get_scraper_objects_from_fixtures(Stage)[0]
+    columns = stage.results("rank", "rider_name", "team_name", "time",
+                            as_columns=True)
+    df = to_frame(columns)
+    assert list(df.columns) == list(columns)
+    assert isinstance(df["team_name"].dtype, pd.CategoricalDtype)
+    assert pd.api.types.is_timedelta64_dtype(df["time"])
+
+def test_table_to_arrow() -> None:
+    pa = pytest.importorskip("pyarrow")
+    f_utils = FixturesUtils(fixtures_path="tests/fixtures/")
+    stage = f_utils.get_scraper_objects_from_fixtures(Stage)[0]
+    table = to_arrow(stage.results("rank", "team_name", "time",
+                                   as_columns=True))
+    assert pa.types.is_dictionary(table.schema.field("team_name").type)
+    assert table.schema.field("time").type == pa.duration("s")
+
+def test_parsing_doesnt_modify_html() -> None:
+    f_utils = FixturesUtils(fixtures_path="tests/fixtures/")
+    for scraper_class in (Race, RaceStartlist, Rider, RiderResults, Stage):
+        for obj in f_utils.get_scraper_objects_from_fixtures(scraper_class):
+            html_before = obj.html.html
+            first = obj.parse(exceptions_to_ignore=(Exception,))
+            assert obj.html.html == html_before
+            assert obj.parse(exceptions_to_ignore=(Exception,)) == first
+
+def test_parsing_from_threads() -> None:
+    f_utils = FixturesUtils(fixtures_path="tests/fixtures/")
+    stages = f_utils.get_scraper_objects_from_fixtures(Stage)
+    # fresh objects, so memoized values are computed from all threads at once
+    fresh_stages = f_utils.get_scraper_objects_from_fixtures(Stage)
+    for stage, fresh_stage in zip(stages, fresh_stages):
+        expected = stage.parse(exceptions_to_ignore=(Exception,))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(
+                lambda _: fresh_stage.parse(
+                    exceptions_to_ignore=(Exception,)),
+                range(8)))
+        assert all(result == expected for result in results)
+
+def test_startlist() -> None:
+    f_utils = FixturesUtils(fixtures_path="tests/fixtures/")
+    for startlist in f_utils.get_scraper_objects_from_fixtures(RaceStartlist):
+        correct = f_utils.get_data_fixture(startlist.relative_url())
+        assert startlist.startlist() == correct["startlist"]
+        assert startlist.startlist(as_columns=True) == \
+            table_to_columns(correct["startlist"])
+        assert startlist.startlist("rider_url", "nationality",
+                                   as_columns=True) == \
+            table_to_columns([{"rider_url": row["rider_url"],
+                               "nationality": row["nationality"]}
+                              for row in correct["startlist"]])
+        # interned teams are equal and the same objects in both startlists
+        interned = startlist.startlist(intern_teams=True)
+        assert interned == correct["startlist"]
+        interned_again = startlist.startlist("team_name", "team_url",
+                                             as_columns=True,
+                                             intern_teams=True)
+        for row, team_name, team_url in zip(interned,
+                                            interned_again["team_name"],
+                                            interned_again["team_url"]):
+            assert row["team_name"] is team_name
+            assert row["team_url"] is team_url
+
+def test_rider_profile() -> None:
+    f_utils = FixturesUtils(fixtures_path="tests/fixtures/")
+    for rider in f_utils.get_scraper_objects_from_fixtures(Rider):
+        profile = rider.profile()
+        for field, value in profile.items():
+            assert getattr(rider, field)() == value
+        assert "profile" not in rider.parse()
@@ -0,0 +1,378 @@
+import asyncio
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator
+
+import pytest
+import requests
+
+from procyclingstats import (AsyncTransport, HTMLCache, HTTPSession, Nation,
+                             RateLimiter, RecordingSession, ReplaySession,
+                             Rider, ThreadedTransport, set_rate_limiter)
+
+PAGE = ("<html><body><div class='page-title'><div class='main'>" +
+        "<h1>{title}</h1></div></div><div class='page-content'>" +
+        "<div>content</div></div></body></html>")
+
+
+class PagesHandler(BaseHTTPRequestHandler):
+    """
+    Request handler that serves minimal valid PCS page for every path and
+    stores requested paths to `self.server.paths`.
+    """
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None: # pylint: disable=invalid-name
+        self.server.paths.append(self.path) # type: ignore
+        if "slow" in self.path:
+            time.sleep(0.2)
+        if ("etag" in self.path and
+                self.headers.get("If-None-Match") == '"v1"'):
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if ("throttle" in self.path and
+                self.server.paths.count(self.path) <= 2): # type: ignore
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        title = self.path.strip("/")
+        if "missing" in self.path:
+            title = "Page not found"
+        encoding = "utf-8"
+        if "cp1250" in self.path:
+            encoding = "windows-1250"
+            title = "Pogačar"
+        body = PAGE.format(title=title).encode(encoding)
+        self.send_response(200)
+        self.send_header("Content-Type", f"text/html; charset={encoding}")
+        self.send_header("Content-Length", str(len(body)))
+        if "etag" in self.path:
+            self.send_header("ETag", '"v1"')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[ThreadingHTTPServer]:
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), PagesHandler)
+    httpd.paths = [] # type: ignore
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def base_url(httpd: ThreadingHTTPServer) -> str:
+    return f"http://127.0.0.1:{httpd.server_address[1]}/"
+
+
+class LocalRider(Rider):
+    """Rider scraper that makes requests to local testing server."""
+    BASE_URL = ""
+
+
+def test_session_reuses_connections(server: ThreadingHTTPServer) -> None:
+    session = HTTPSession(pool_maxsize=2)
+    for i in range(5):
+        LocalRider(f"{base_url(server)}rider/rider-{i}", session=session)
+    stats: Dict[str, int] = session.stats()
+    assert stats["requests"] == 5
+    assert stats["connections"] == 1
+    assert stats["reused"] == 4
+    session.close()
+
+
+def test_session_default_headers(server: ThreadingHTTPServer) -> None:
+    session = HTTPSession(headers={"X-Test": "1"}, timeout=5)
+    response = session.get(base_url(server))
+    assert response.request.headers["X-Test"] == "1"
+    session.close()
+
+
+def test_fetch_many_preserves_order(server: ThreadingHTTPServer) -> None:
+    session = HTTPSession(pool_maxsize=4)
+    urls = [f"{base_url(server)}rider/rider-{i}" for i in range(10)]
+    urls.insert(3, f"{base_url(server)}rider/missing")
+    riders = LocalRider.fetch_many(urls, max_workers=4, session=session)
+    assert len(riders) == len(urls)
+    assert isinstance(riders[3], ValueError)
+    riders.pop(3)
+    urls.pop(3)
+    for url, rider in zip(urls, riders):
+        assert isinstance(rider, LocalRider)
+        assert rider.url == url
+        assert rider.name() == url.split("/", 3)[-1]
+    session.close()
+
+
+class InProcessTransport(AsyncTransport):
+    """Asynchronous transport serving pages without any network."""
+
+    class Response:
+        def __init__(self, text: str) -> None:
+            self.status_code = 200
+            self.headers = {}
+            self.text = text
+
+    def __init__(self, delay: float = 0) -> None:
+        self.urls = []
+        self.delay = delay
+
+    async def get(self, url: str, **kwargs) -> "InProcessTransport.Response":
+        self.urls.append(url)
+        await asyncio.sleep(self.delay)
+        title = "Page not found" if "missing" in url else url.split("/")[-1]
+        return self.Response(PAGE.format(title=title))
+
+
+def test_afetch_many_with_transport() -> None:
+    transport = InProcessTransport()
+    urls = ["rider/a", "rider/missing", "rider/b"]
+    riders = asyncio.run(
+        Rider.afetch_many(urls, concurrency=2, transport=transport))
+    assert sorted(transport.urls) == sorted(Rider.BASE_URL + url
+                                            for url in urls)
+    assert riders[0].name() == "a" # type: ignore
+    assert isinstance(riders[1], ValueError)
+    assert riders[2].name() == "b" # type: ignore
+
+
+def test_afetch_with_session(server: ThreadingHTTPServer) -> None:
+    session = HTTPSession()
+    rider = asyncio.run(LocalRider.afetch(f"{base_url(server)}rider/c",
+                                          session=session))
+    assert rider.name() == "rider/c"
+    assert session.stats()["requests"] == 1
+    session.close()
+
+
+def test_single_flight_coalesces_requests(
+        server: ThreadingHTTPServer) -> None:
+    session = HTTPSession(pool_maxsize=4)
+    url = f"{base_url(server)}rider/slow"
+    riders = LocalRider.fetch_many([url, url + "/", url, url], max_workers=4,
+                                   session=session)
+    assert server.paths == ["/rider/slow"]
+    assert all(rider.html is riders[0].html for rider in riders)
+    session.close()
+
+    transport = InProcessTransport(delay=0.05)
+    riders = asyncio.run(Rider.afetch_many(["rider/d"] * 3,
+                                           transport=transport))
+    assert transport.urls == [Rider.BASE_URL + "rider/d"]
+    assert all(rider.name() == "d" for rider in riders)
+
+
+def test_nation_memoizes_sections(server: ThreadingHTTPServer) -> None:
+    class LocalNation(Nation):
+        BASE_URL = base_url(server)
+
+    session = HTTPSession(pool_maxsize=4)
+    nation = LocalNation(2020, "nation/slovenia", session=session)
+    nation.prefetch()
+    assert len(server.paths) == 4
+    assert nation.wins() == 0
+    assert nation.pcs_points() == 0
+    assert len(server.paths) == 4
+
+    nation = LocalNation(2021, "nation/slovenia", session=session)
+    threads = [threading.Thread(target=nation.wins) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(server.paths) == 5
+    nation.update_html()
+    assert len(server.paths) == 9
+    assert nation.wins() == 0
+    assert len(server.paths) == 9
+    session.close()
+
+
+def test_html_cache(server: ThreadingHTTPServer, tmp_path) -> None:
+    cache = HTMLCache(str(tmp_path), policies=[
+        ("rider/fresh", None),
+        ("rider/stale", 0)
+    ])
+    for _ in range(3):
+        LocalRider(f"{base_url(server)}rider/fresh/", cache=cache)
+        LocalRider(f"{base_url(server)}rider/stale", cache=cache)
+    assert server.paths == ["/rider/fresh/"] + ["/rider/stale"] * 3
+    assert cache.stats() == {"hits": 2, "misses": 2, "revalidated": 0,
+                             "refetched": 2}
+    # invalid pages aren't cached
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            LocalRider(f"{base_url(server)}rider/missing", cache=cache)
+    assert cache.lookup(f"{base_url(server)}rider/missing") is None
+    entry = cache.lookup(f"{base_url(server)}rider/fresh")
+    assert entry is not None
+    assert "<h1>rider/fresh</h1>" in entry.text()
+
+    # relative URLs are relative to procyclingstats like in scraper objects
+    html = PAGE.format(title="Tadej Pogačar")
+    cache.store("rider/tadej-pogacar", html)
+    for url in ("https://www.procyclingstats.com/rider/tadej-pogacar",
+                "/rider/tadej-pogacar/"):
+        entry = cache.lookup(url)
+        assert entry is not None and entry.text() == html
+    cache.delete("rider/tadej-pogacar")
+    assert cache.lookup("rider/tadej-pogacar") is None
+
+
+def test_html_cache_corrupted_entries(tmp_path) -> None:
+    cache = HTMLCache(str(tmp_path))
+    html = PAGE.format(title="rider/a")
+    for url, corrupt in (("rider/a", lambda data: data.replace(b"\n", b"")),
+                         ("rider/b", lambda data: b"{" + data),
+                         ("rider/c", lambda data: data[:-10])):
+        cache.store(url, html)
+        path = cache._path(url) # pylint: disable=protected-access
+        with open(path, "rb") as file:
+            data = file.read()
+        with open(path, "wb") as file:
+            file.write(corrupt(data))
+        assert cache.get(url) is None
+        assert not os.path.exists(path)
+    assert cache.stats()["misses"] == 3
+
+
+def test_html_cache_default_ttl(tmp_path) -> None:
+    url = "https://www.procyclingstats.com/rider/tadej-pogacar"
+    assert HTMLCache(str(tmp_path)).ttl(url) == 24 * 3600
+    assert HTMLCache(str(tmp_path), default_ttl=5).ttl(url) == 5
+    assert HTMLCache(str(tmp_path), default_ttl=None).ttl(url) is None
+    cache = HTMLCache(str(tmp_path), policies=[("rider/", 60)],
+                      default_ttl=5)
+    assert cache.ttl(url) == 60
+    assert cache.ttl("team/uae-team-emirates-2024") == 5
+
+
+def test_html_cache_revalidation(server: ThreadingHTTPServer,
+                                 tmp_path) -> None:
+    cache = HTMLCache(str(tmp_path), policies=[(".", 0)])
+    url = f"{base_url(server)}rider/etag"
+    rider = LocalRider(url, cache=cache)
+    html = rider.html
+    rider.update_html()
+    # DOM is reused when the page hasn't changed
+    assert rider.html is html
+    LocalRider(url, cache=cache)
+    assert cache.stats() == {"hits": 0, "misses": 1, "revalidated": 2,
+                             "refetched": 0}
+    assert len(server.paths) == 3
+
+
+def test_bytes_html(server: ThreadingHTTPServer, tmp_path) -> None:
+    html = PAGE.format(title="Pogačar").replace(
+        "<html>", "<html><head><meta charset='windows-1250'></head>")
+    rider = Rider("rider/x", html=html.encode("cp1250"), update_html=False)
+    assert rider.name() == "Pogačar"
+
+    cache = HTMLCache(str(tmp_path))
+    url = f"{base_url(server)}rider/cp1250"
+    for _ in range(2):
+        assert LocalRider(url, cache=cache).name() == "Pogačar"
+    entry = cache.lookup(url)
+    assert entry is not None and entry.encoding == "cp1250"
+    assert "Pogačar".encode("cp1250") in entry.body
+    assert len(server.paths) == 1
+
+
+def test_record_and_replay(server: ThreadingHTTPServer, tmp_path) -> None:
+    archive = str(tmp_path / "run.zip")
+    urls = [f"{base_url(server)}rider/slow", f"{base_url(server)}rider/e",
+            f"{base_url(server)}rider/missing"]
+    recording = RecordingSession(archive)
+    with_network = LocalRider.fetch_many(urls, session=recording)
+    recording.close()
+    requests_count = len(server.paths)
+
+    session = ReplaySession(archive)
+    riders = LocalRider.fetch_many(urls, session=session)
+    assert [str(r) for r in riders] == [str(r) for r in with_network]
+    riders = asyncio.run(LocalRider.afetch_many(
+        urls[:2], transport=ThreadedTransport(session)))
+    assert riders[0].name() == "rider/slow"
+    assert session.stats()["requests"] == 5
+    assert len(server.paths) == requests_count
+    assert session._session is None # pylint: disable=protected-access
+    with pytest.raises(requests.ConnectionError):
+        LocalRider(f"{base_url(server)}rider/f", session=session)
+
+    # recorded latency is emulated only when enabled
+    start = time.perf_counter()
+    LocalRider(urls[0], session=session)
+    assert time.perf_counter() - start < 0.1
+    start = time.perf_counter()
+    LocalRider(urls[0], session=ReplaySession(archive, emulate_latency=True))
+    assert time.perf_counter() - start >= 0.2
+
+
+def test_rate_limiter_retries_throttled(server: ThreadingHTTPServer) -> None:
+    rate_limiter = RateLimiter(rate=100, max_rate=100, min_rate=50,
+                               concurrency=2,
+                               backoff_base=0.01, cooldown=0)
+    set_rate_limiter(rate_limiter)
+    try:
+        rider = LocalRider(f"{base_url(server)}rider/throttle")
+        assert rider.name() == "rider/throttle"
+        riders = asyncio.run(LocalRider.afetch_many(
+            [f"{base_url(server)}rider/throttle-{i}" for i in range(3)],
+            session=HTTPSession()))
+        assert all(isinstance(r, LocalRider) for r in riders)
+    finally:
+        set_rate_limiter(None)
+    stats = rate_limiter.stats()
+    assert stats["requests"] == 12
+    assert stats["throttled"] == 8
+    assert stats["retries"] == 8
+
+
+def test_replay_throttled_recording(server: ThreadingHTTPServer,
+                                    tmp_path) -> None:
+    archive = str(tmp_path / "run.zip")
+    url = f"{base_url(server)}rider/throttle"
+    set_rate_limiter(RateLimiter(backoff_base=0.01))
+    try:
+        recording = RecordingSession(archive)
+        LocalRider(url, session=recording)
+        recording.close()
+
+        set_rate_limiter(RateLimiter.without_pacing())
+        start = time.perf_counter()
+        rider = LocalRider(url, session=ReplaySession(archive))
+        assert time.perf_counter() - start < 0.1
+    finally:
+        set_rate_limiter(None)
+    assert rider.name() == "rider/throttle"
+    assert len(server.paths) == 3
+
+
+class FailingSession(HTTPSession):
+    def get(self, url: str, **kwargs) -> requests.Response:
+        raise requests.ConnectionError(url)
+
+
+def test_rate_limiter_not_raised_by_failed_requests() -> None:
+    rate_limiter = RateLimiter(rate=10, concurrency=2)
+    set_rate_limiter(rate_limiter)
+    try:
+        for _ in range(3):
+            with pytest.raises(requests.ConnectionError):
+                LocalRider("http://localhost/rider/a",
+                           session=FailingSession())
+    finally:
+        set_rate_limiter(None)
+    assert rate_limiter.rate == 10
+    assert rate_limiter.concurrency == 2
+    assert rate_limiter.stats()["requests"] == 3
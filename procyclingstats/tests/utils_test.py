@@ -0,0 +1,32 @@
+import pytest
+
+from procyclingstats.utils import add_times, seconds_to_time, time_to_seconds
+
+
+@pytest.mark.parametrize("time, seconds", [
+    ("4:05:09", 14709),
+    ("0:00:00", 0),
+    ("3:07", 187),
+    ("59", 59),
+    ("-0:20", -20),
+    ("-1:02:03", -3723),
+])
+def test_time_to_seconds(time: str, seconds: int) -> None:
+    assert time_to_seconds(time) == seconds
+
+
+@pytest.mark.parametrize("seconds, time", [
+    (14709, "4:05:09"),
+    (0, "0:00:00"),
+    (187, "0:03:07"),
+    (-20, "-0:00:20"),
+    (-3723, "-1:02:03"),
+    (100 * 3600, "100:00:00"),
+])
+def test_seconds_to_time(seconds: int, time: str) -> None:
+    assert seconds_to_time(seconds) == time
+
+
+def test_add_times() -> None:
+    assert add_times("4:05:09", "3:07") == "4:08:16"
+    assert add_times("0:10:00", "-0:20") == "0:09:40"
@@ -1,2 +1,3 @@
 from data.data import get_nations, get_nation, get_teams, get_team, get_riders, get_rider, \
-    get_average_age, get_youngest_age, get_wins_ranking, get_wins_list_for_race, get_race_details, get_equipment_for_teams, get_number_of_wins_for_teams
+    get_wins_ranking, get_wins_ranking_top3, get_wins_list_for_race, get_race_details, get_equipment_for_teams, get_number_of_wins_for_teams, \
+    WORKERS
@@ -1,15 +1,101 @@
-import country_converter as coco
+import atexit
+import csv
 import diskcache
+import functools
+import os
 import sys
 from datetime import datetime
-from typing import Any
-from procyclingstats import Ranking, Nation, Team, Teams, Rider
+from typing import Any, Optional
+# scrapers are imported by the first call that isn't memoized yet, so loaders
+# with all the results in .cache don't import them at all
+import procyclingstats as pcs
+
+# Loaders call the functions below from this many threads at once (PCS_WORKERS=1
+# to load everything serially), the rate limiter still bounds requests to PCS.
+# The memoization caches are safe to use from multiple threads and concurrent
+# requests of the same page are coalesced by the scrapers.
+WORKERS = max(1, int(os.environ.get('PCS_WORKERS', '16')))
+# Nation.prefetch requests up to 4 pages at once from every thread, the session
+# keeps connections of all of them alive
+POOL_MAXSIZE = WORKERS * 4
+
+# Record all responses to an archive (PCS_RECORD=run.zip) or replay them from it
+# (PCS_REPLAY=run.zip, PCS_REPLAY_LATENCY=1 to wait as long as when recording),
+# so loader runs can be benchmarked without network. The HTML cache is skipped
+# then so every page goes through the archive, the memoized results in .cache
+# have to be cleared by hand.
+if os.environ.get('PCS_REPLAY'):
+    pcs.set_session(pcs.ReplaySession(os.environ['PCS_REPLAY'],
+                                      emulate_latency=os.environ.get('PCS_REPLAY_LATENCY') == '1'))
+elif os.environ.get('PCS_RECORD'):
+    recording_session = pcs.RecordingSession(os.environ['PCS_RECORD'], pool_maxsize=POOL_MAXSIZE)
+    pcs.set_session(recording_session)
+    atexit.register(recording_session.save)
+else:
+    # the session and the cache only keep their settings until the first request,
+    # so requests and selectolax aren't imported here
+    pcs.configure_session(pool_maxsize=POOL_MAXSIZE)
+    # Cache raw HTML pages as well, so the loaders can be rerun after a parser fix
+    # (and the memoized results dropped) without fetching the pages again
+    pcs.set_cache(pcs.HTMLCache('.cache/html'))
+# Back off and retry when PCS is overloaded instead of failing the whole build.
+# Replayed responses don't come from PCS, so replaying isn't slowed down, but the
+# recorded throttled responses are still retried to replay the run faithfully.
+if os.environ.get('PCS_REPLAY'):
+    pcs.set_rate_limiter(pcs.RateLimiter.without_pacing())
+else:
+    pcs.set_rate_limiter(pcs.RateLimiter())
+
+
+# ISO2 code, ISO numeric code, short name and PCS nation slugs of every country,
+# generated with country_converter so the lookup converts the same way it does
+COUNTRIES_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'countries.csv')
+
+
+@functools.cache
+def get_countries() -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+    '''
+    Returns countries from countries.csv keyed by ISO2 code and by PCS nation slug.
+    '''
+    by_iso2, by_slug = {}, {}
+    with open(COUNTRIES_CSV, newline='', encoding='utf-8') as file:
+        for row in csv.DictReader(file):
+            country = {'ISO2': row['iso2'], 'ISOnumeric': int(row['isonumeric']), 'name_short': row['name_short']}
+            by_iso2[row['iso2']] = country
+            for slug in row['pcs_slugs'].split():
+                by_slug[slug] = country
+    return by_iso2, by_slug
+
+def convert_country(name: str, to: str, src: Optional[str] = None) -> Any:
+    '''
+    Converts ISO2 code or PCS nation slug (e.g. great-britain) to ISO2, ISOnumeric or name_short,
+    the same as country_converter does. Names missing in countries.csv are converted by country_converter.
+    '''
+    by_iso2, by_slug = get_countries()
+    country = by_iso2.get(name) if src in (None, 'ISO2') else None
+    if country is None and src is None:
+        country = by_slug.get(name)
+    if country is not None and to in country:
+        return country[to]
+    return convert_country_with_coco(name, to, src)
+
+@functools.lru_cache(maxsize=None)
+def convert_country_with_coco(name: str, to: str, src: Optional[str]) -> Any:
+    # country_converter loads pandas tables and matches names by regexes, so it's
+    # imported only for names missing in countries.csv and every name is
+    # converted only once
+    return get_country_converter().convert(names=name, src=src, to=to)
+
+@functools.cache
+def get_country_converter():
+    import country_converter as coco
+    return coco.CountryConverter()
 
 
 @diskcache.Cache('.cache/get_nations').memoize()
 def get_nations(year: int) -> list[str, Any]:
     try:
-        ranking_nations = Ranking(f'statistics.php?season={year}&level=1&sekse=1&filter=Filter&p=nations')
+        ranking_nations = pcs.Ranking(f'statistics.php?season={year}&level=1&sekse=1&filter=Filter&p=nations')
         ranking_nations = ranking_nations.nations_ranking()
     except Exception as e:
         print(e)
@@ -20,15 +106,17 @@ def get_nations(year: int) -> list[str, Any]:
 @diskcache.Cache('.cache/get_nation').memoize()
 def get_nation(year: int, nation_url: str) -> dict[str, Any]:
     try:
-        nation = Nation(year, nation_url)
+        nation = pcs.Nation(year, nation_url)
+        # all four sections are needed, request them at once
+        nation.prefetch()
     except Exception as e:
         print(e)
         sys.exit()
 
-    nationality = coco.CountryConverter().convert(names=nation.name(), to='ISO2')
+    nationality = convert_country(nation.name(), to='ISO2')
     nationality = nationality if nationality else None
 
-    nation_ison = coco.CountryConverter().convert(names=nation.name(), to='ISOnumeric')
+    nation_ison = convert_country(nation.name(), to='ISOnumeric')
     nation_ison = nation_ison if nation_ison else None
 
     data = {}
@@ -44,12 +132,12 @@ def get_nation(year: int, nation_url: str) -> dict[str, Any]:
 
 @diskcache.Cache('.cache/get_teams').memoize()
 def get_teams(year: int) -> list[str]:
-    return Teams().teams(year)
+    return pcs.Teams().teams(year)
 
 @diskcache.Cache('.cache/get_team').memoize()
 def get_team(team_url: str) -> dict[str, Any]:
     try:
-        team = Team(team_url)
+        team = pcs.Team(team_url)
     except Exception as e:
         print(e)
         sys.exit()
@@ -75,18 +163,11 @@ def get_riders(year: int) -> list[str]:
 @diskcache.Cache('.cache/get_rider').memoize()
 def get_rider(rider_url: str) -> dict[str, Any]:
     try:
-        rider = Rider(rider_url.strip())
+        rider = pcs.Rider(rider_url.strip())
     except Exception:
         return {}
 
-    data = {}
-    data['name'] = rider.name()
-    data['nationality'] = rider.nationality()
-    data['birthdate'] = rider.birthdate()
-    data['place_of_birth'] = rider.place_of_birth()
-    data['weight'] = rider.weight()
-    data['height'] = rider.height()
-    data['image_url'] = rider.image_url()
+    data = rider.profile()
     data['teams_history'] = {str(d.get('season')): d.get('team_url') for d in rider.teams_history('season', 'team_url') if d.get('season') is not None}
     pcs_results = rider.points_per_season_history()
     data['pcs_points'] = {str(d['season']): d['points'] for d in pcs_results} if pcs_results is not [] else {}
@@ -97,9 +178,8 @@ def get_rider(rider_url: str) -> dict[str, Any]:
 @diskcache.Cache(".cache/get_wins_ranking_top3").memoize()
 def get_wins_ranking_top3(year: int) -> list[dict[str, Any]]:
     # Get the wins ranking for the given year
-    ranking = Ranking(f"statistics.php?year={year}&mw=1&filter=Filter&p=riders&s=wins-on-wt-level")
+    ranking = pcs.Ranking(f"statistics.php?year={year}&mw=1&filter=Filter&p=riders&s=wins-on-wt-level")
     ranking = ranking.statistics_ranking('rank', 'rider_name', 'number_of_wins', 'rider_url')
-    converter = coco.CountryConverter()
 
     # Only use the top 3 riders for the ranking
     # Separate top 3 and rest
@@ -109,20 +189,20 @@ def get_wins_ranking_top3(year: int) -> list[dict[str, Any]]:
     for rider in top3:
         # Get the rider information
         rider_url = rider['rider_url']
-        rider_data = Rider(rider_url)
+        rider_data = pcs.Rider(rider_url)
 
         rider['picture'] = rider_data.image_url()
 
         # Conver the nationality from ISO2 to string
         rider['nationality'] = rider_data.nationality()
-        rider['nationality'] = converter.convert(names=rider['nationality'], src="ISO2", to="name_short")
+        rider['nationality'] = convert_country(rider['nationality'], src="ISO2", to="name_short")
 
     return top3
 
 @diskcache.Cache(".cache/get_wins_ranking").memoize()
 def get_wins_ranking(year: int) -> list[dict[str, Any]]:
     # Get the wins ranking for the given year
-    ranking = Ranking(f"statistics.php?year={year}&mw=1&filter=Filter&p=riders&s=wins-on-wt-level")
+    ranking = pcs.Ranking(f"statistics.php?year={year}&mw=1&filter=Filter&p=riders&s=wins-on-wt-level")
     ranking = ranking.statistics_ranking('rank', 'rider_name', 'number_of_wins', 'rider_url')
 
     # Build lookup dictionary
@@ -146,14 +226,13 @@ def get_wins_list_for_race(race: str) -> list[dict[str, Any]]:
     Returns the list with the riders winning the given race and the number of wins.
     '''
     # Extract for every race the most winning riders
-    ranking = Ranking(f'race.php?fnation=&stripped=0&filter=Filter&id1={race}&id2=results&id3=most-wins')
+    ranking = pcs.Ranking(f'race.php?fnation=&stripped=0&filter=Filter&id1={race}&id2=results&id3=most-wins')
     ranking = ranking.individual_wins_ranking('rider_name', 'nationality', 'first_places', 'rank')
 
     # Convert nation names to ISO3 codes
-    cc = coco.CountryConverter()
     for rider in ranking:
         nationality = rider['nationality']
-        iso3 = cc.convert(names=nationality, to='ISOnumeric')  # Convert the nation name to ISO3 code
+        iso3 = convert_country(nationality, to='ISOnumeric')  # Convert the nation name to ISO3 code
         rider['nationality'] = iso3 if iso3 else None
 
     return ranking
@@ -166,10 +245,10 @@ def get_race_details(race: str) -> list[dict[str, Any]]:
         - Distance
         - Average Speed
     '''
-    ranking_fastest = Ranking(f'race/{race}/results/fastest-editions')
+    ranking_fastest = pcs.Ranking(f'race/{race}/results/fastest-editions')
     ranking_fastest = ranking_fastest.statistics_ranking('year', 'distance', 'average_speed')
 
-    ranking_dropouts = Ranking(f'race/{race}/results/dropouts-per-edition')
+    ranking_dropouts = pcs.Ranking(f'race/{race}/results/dropouts-per-edition')
     ranking_dropouts = ranking_dropouts.statistics_ranking('year', 'participants', 'dropouts')
 
     # Convert to dictionaries keyed by year
@@ -194,7 +273,7 @@ def get_equipment_for_teams(year: int) -> list[dict[str, Any]]:
     '''
     Returns the equipment used by the team for the given year.
     '''
-    ranking = Ranking(f'statistics.php?season={year}&level=wt&filter=Filter&p=gear')
+    ranking = pcs.Ranking(f'statistics.php?season={year}&level=wt&filter=Filter&p=gear')
     ranking = ranking.statistics_ranking('team_name', 'bike', 'groupset', 'wheels')
 
     return ranking
@@ -205,7 +284,7 @@ def get_number_of_wins_for_teams(year: int) -> list[dict[str, Any]]:
     '''
     Returns the number of wins for the teams for the given year.
     '''
-    ranking = Ranking(f'statistics.php?year={year}&filter=Filter&p=teams&s=wt-wins-for-wt-teams')
+    ranking = pcs.Ranking(f'statistics.php?year={year}&filter=Filter&p=teams&s=wt-wins-for-wt-teams')
     ranking = ranking.statistics_ranking('team_name', 'team_url', 'number_of_wins')
 
     return ranking
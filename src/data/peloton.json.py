@@ -1,6 +1,9 @@
+import functools
 import json
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 from data import *
 
 # Configure logging
@@ -17,33 +20,51 @@ data = {
     }
 }
 
-for year in range(1930, 2026):
+
+def load_year(year: int) -> dict[str, Any]:
     logger.info(year)
     # data['nations'][<year>][<name>] = {...}
-    data['nations'][str(year)] = {}
-    for nation_url in get_nations(year):
-        nation = get_nation(year, nation_url)
-        data['nations'][str(year)][nation['name']] = nation
+    nations = {}
+    for nation in fetch_executor.map(functools.partial(get_nation, year), get_nations(year)):
+        nations[nation['name']] = nation
 
     # data['teams'][<year>][<name>] = {...}
-    # data['teams'][str(year)] = {}
-    # for team_url in get_teams(year):
-    #     team = get_team(team_url)
-    #     data['teams'][str(year)][team['name']] = team
+    # teams = {}
+    # for team in fetch_executor.map(get_team, get_teams(year)):
+    #     teams[team['name']] = team
 
     # data['riders'][<year>][<name>] = {...}
-    data['riders'][str(year)] = {}
-    for rider_url in get_riders(year):
-        rider = get_rider(rider_url)
-
+    riders = {}
+    for rider in fetch_executor.map(get_rider, get_riders(year)):
         if rider:
-            data['riders'][str(year)][rider['name']] = rider
+            riders[rider['name']] = rider
+
+    return {
+        'nations': nations,
+        'riders': riders,
+        'top3': get_wins_ranking_top3(year),
+        'all': get_wins_ranking(year)
+    }
 
-    wins_ranking_top3 = get_wins_ranking_top3(year)
-    data['wins']['top3'][f'{year}'] = wins_ranking_top3
 
-    wins_ranking = get_wins_ranking(year)
-    data['wins']['all'][f'{year}'] = wins_ranking
+# Years are loaded by a few threads and requests of every year are made by the
+# shared fetch threads, so the count of threads is bounded. Year tasks only
+# wait for fetch tasks, which don't wait for anything, so they can't deadlock.
+# Results are collected in order of the years, nations and riders, so the
+# output is the same as when loading serially.
+years = range(1930, 2026)
+years_executor = ThreadPoolExecutor(max_workers=min(4, WORKERS))
+fetch_executor = ThreadPoolExecutor(max_workers=WORKERS)
+try:
+    for year, year_data in zip(years, years_executor.map(load_year, years)):
+        data['nations'][str(year)] = year_data['nations']
+        data['riders'][str(year)] = year_data['riders']
+        data['wins']['top3'][f'{year}'] = year_data['top3']
+        data['wins']['all'][f'{year}'] = year_data['all']
+finally:
+    # don't load the remaining years when one of them failed
+    years_executor.shutdown(cancel_futures=True)
+    fetch_executor.shutdown(cancel_futures=True)
 
 # Write the data as a JSON format to stdout
 sys.stdout.buffer.write(json.dumps(data, indent=4).encode('utf-8'))
@@ -1,6 +1,5 @@
 import json
 import sys
-import country_converter as coco
 import logging
 from data import get_wins_list_for_race, get_race_details
 
@@ -19,9 +18,6 @@ data = {
     'raceInfo': {}
 }
 
-# Initialize the country converter (maps country names to ISO3 codes)
-cc = coco.CountryConverter()
-
 for race in racelist:
     logger.info(race)
     # Extract for the given race the most winning riders